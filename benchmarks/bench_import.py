@@ -0,0 +1,13 @@
+''' Import time of the package, measured in a fresh interpreter for each sample.'''
+
+
+def timeraw_import_stores():
+    return "import sveltish.stores"
+
+
+def timeraw_import_signals():
+    return "import sveltish.signals"
+
+
+def timeraw_import_all():
+    return "import sveltish.stores, sveltish.signals, sveltish.utils"
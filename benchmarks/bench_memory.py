@@ -0,0 +1,43 @@
+''' Memory per node of the stores and signals, in the format of airspeed velocity (asv).'''
+import gc, tracemalloc
+from sveltish import stores, signals
+
+
+def allocated(make, n=10000) -> float:
+    ''' Bytes allocated per node by `n` calls of `make`.'''
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        nodes = [make(i) for i in range(n)]
+        return (tracemalloc.get_traced_memory()[0] - before) / n
+    finally: tracemalloc.stop()
+
+
+class Memory:
+    ''' Bytes allocated per node.'''
+    unit = 'bytes'
+
+    def track_writable(self): return allocated(stores.writable)
+
+    def track_subscribed(self):
+        def make(i):
+            w = stores.writable(i)
+            return w, w.subscribe(lambda x: None)
+        return allocated(make)
+
+    def track_derived(self): return allocated(lambda i: stores.derived(stores.writable(i), lambda x: x))
+
+    def track_signal(self): return allocated(signals.writable)
+
+    def track_reaction(self):
+        def make(i):
+            s = signals.writable(i)
+            return s, signals.reaction(lambda: s.read())
+        return allocated(make)
+
+    def track_computed(self):
+        def make(i):
+            s = signals.writable(i)
+            return s, signals.computed(lambda: s.read())
+        return allocated(make)
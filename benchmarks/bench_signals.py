@@ -0,0 +1,37 @@
+''' Benchmarks of the hot paths of `sveltish.signals`, in the format of airspeed velocity (asv).'''
+from sveltish.signals import writable, reaction, computed
+
+
+class Reaction:
+    ''' Re-running a reaction that reads N signals, when one of them changes.'''
+    params = [1, 10, 100]
+    param_names = ['dependencies']
+
+    def setup(self, n):
+        self.signals = [writable(i) for i in range(n)]
+        self.reaction = reaction(lambda: sum(s.read() for s in self.signals))
+        self.i = 0
+
+    def teardown(self, n): self.reaction.cancel()
+
+    def time_write(self, n):
+        self.i += 1
+        self.signals[0].write(self.i)
+
+    def time_create_cancel(self, n):
+        reaction(lambda: sum(s.read() for s in self.signals)).cancel()
+
+
+class Computed:
+    ''' Writing the source of a computed read by a reaction.'''
+    def setup(self):
+        self.source = writable(0)
+        double = computed(lambda: self.source.read() * 2)
+        self.reaction = reaction(lambda: double())
+        self.i = 0
+
+    def teardown(self): self.reaction.cancel()
+
+    def time_write(self):
+        self.i += 1
+        self.source.write(self.i)
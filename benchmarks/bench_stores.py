@@ -0,0 +1,109 @@
+''' Benchmarks of the hot paths of `sveltish.stores`, in the format of airspeed velocity (asv).
+
+Only the API available since the first releases is used, so results can be compared across versions.'''
+from sveltish.stores import writable, derived
+from sveltish.utils import compose, noop
+
+
+class StoreSet:
+    ''' `Store.set` notifying N subscribers.'''
+    params = [1, 100, 1000]
+    param_names = ['subscribers']
+
+    def setup(self, n):
+        self.store = writable(0)
+        self.unsubscribers = [self.store.subscribe(noop) for _ in range(n)]
+        self.i = 0
+
+    def teardown(self, n):
+        for unsubscribe in self.unsubscribers: unsubscribe()
+
+    def time_set(self, n):
+        self.i += 1
+        self.store.set(self.i)
+
+    def time_subscribe_unsubscribe(self, n):
+        self.store.subscribe(noop)()
+
+
+class DerivedChain:
+    ''' A change propagating through a chain of D derived stores.'''
+    params = [1, 10, 100]
+    param_names = ['depth']
+
+    def setup(self, depth):
+        self.source = writable(0)
+        store = self.source
+        for _ in range(depth): store = derived(store, lambda x: x + 1)
+        self.unsubscribe = store.subscribe(noop)
+        self.i = 0
+
+    def teardown(self, depth): self.unsubscribe()
+
+    def time_set(self, depth):
+        self.i += 1
+        self.source.set(self.i)
+
+
+class DerivedDiamond:
+    ''' A change fanning out to W derived stores that fan back in to a single derived store.'''
+    params = [2, 10, 100]
+    param_names = ['width']
+
+    def setup(self, width):
+        self.source = writable(0)
+        branches = [derived(self.source, lambda x, k=k: x + k) for k in range(width)]
+        self.unsubscribe = derived(branches, lambda *xs: sum(xs)).subscribe(noop)
+        self.i = 0
+
+    def teardown(self, width): self.unsubscribe()
+
+    def time_set(self, width):
+        self.i += 1
+        self.source.set(self.i)
+
+
+class Pipes:
+    ''' Pipe chains of L stages, built with `pipe`, `|` and `compose`.'''
+    params = [1, 10, 50]
+    param_names = ['length']
+
+    def setup(self, length):
+        self.functions = [lambda x: x + 1] * length
+        self.composed = compose(*self.functions)
+        self.source = writable(0)
+        self.unsubscribers = [self.source.pipe(*self.functions).subscribe(noop)]
+        store = self.source
+        for f in self.functions: store = store | f
+        self.unsubscribers.append(store.subscribe(noop))
+        self.i = 0
+
+    def teardown(self, length):
+        for unsubscribe in self.unsubscribers: unsubscribe()
+
+    def time_compose_call(self, length): self.composed(1)
+
+    def time_set(self, length):
+        self.i += 1
+        self.source.set(self.i)
+
+    def time_build_or_chain(self, length):
+        store = self.source
+        for f in self.functions: store = store | f
+
+
+class SetAttr:
+    ''' `Store.__setattr__` updating one key of a dict holding N keys.'''
+    params = [10, 1000, 100000]
+    param_names = ['keys']
+
+    def setup(self, n):
+        self.store = writable({f'k{i}': i for i in range(n)})
+        self.unsubscribe = self.store.subscribe(noop)
+        self.i = 0
+
+    def teardown(self, n): self.unsubscribe()
+
+    def time_setattr(self, n):
+        self.i += 1
+        self.store.k0 = self.i
@@ -5,42 +5,254 @@ d = { 'settings': { 'branch': 'main',
                 'doc_host': 'https://fredguth.github.io',
                 'git_url': 'https://github.com/fredguth/sveltish',
                 'lib_path': 'sveltish'},
-  'syms': { 'sveltish.signals': { 'sveltish.signals.Callback': ('signals.html#callback', 'sveltish/signals.py'),
+  'syms': { 'sveltish.aio': { 'sveltish.aio.AsyncDerivedStore': ('aio.html#asyncderivedstore', 'sveltish/aio.py'),
+                              'sveltish.aio.AsyncDerivedStore.__init__': ('aio.html#asyncderivedstore.__init__', 'sveltish/aio.py'),
+                              'sveltish.aio.AsyncDerivedStore.produce': ('aio.html#asyncderivedstore.produce', 'sveltish/aio.py'),
+                              'sveltish.aio.AsyncDerivedStore.recompute': ('aio.html#asyncderivedstore.recompute', 'sveltish/aio.py'),
+                              'sveltish.aio.AsyncReadableStore': ('aio.html#asyncreadablestore', 'sveltish/aio.py'),
+                              'sveltish.aio.AsyncReadableStore.__repr__': ('aio.html#asyncreadablestore.__repr__', 'sveltish/aio.py'),
+                              'sveltish.aio.AsyncReadableStore.set': ('aio.html#asyncreadablestore.set', 'sveltish/aio.py'),
+                              'sveltish.aio.AsyncReadableStore.set_nowait': ('aio.html#asyncreadablestore.set_nowait', 'sveltish/aio.py'),
+                              'sveltish.aio.AsyncReadableStore.update': ('aio.html#asyncreadablestore.update', 'sveltish/aio.py'),
+                              'sveltish.aio.AsyncStore': ('aio.html#asyncstore', 'sveltish/aio.py'),
+                              'sveltish.aio.AsyncStore.__init__': ('aio.html#asyncstore.__init__', 'sveltish/aio.py'),
+                              'sveltish.aio.AsyncStore.__len__': ('aio.html#asyncstore.__len__', 'sveltish/aio.py'),
+                              'sveltish.aio.AsyncStore.__repr__': ('aio.html#asyncstore.__repr__', 'sveltish/aio.py'),
+                              'sveltish.aio.AsyncStore.__set': ('aio.html#asyncstore.__set', 'sveltish/aio.py'),
+                              'sveltish.aio.AsyncStore.__set_nowait': ('aio.html#asyncstore.__set_nowait', 'sveltish/aio.py'),
+                              'sveltish.aio.AsyncStore.__start': ('aio.html#asyncstore.__start', 'sveltish/aio.py'),
+                              'sveltish.aio.AsyncStore.get': ('aio.html#asyncstore.get', 'sveltish/aio.py'),
+                              'sveltish.aio.AsyncStore.join': ('aio.html#asyncstore.join', 'sveltish/aio.py'),
+                              'sveltish.aio.AsyncStore.set': ('aio.html#asyncstore.set', 'sveltish/aio.py'),
+                              'sveltish.aio.AsyncStore.set_nowait': ('aio.html#asyncstore.set_nowait', 'sveltish/aio.py'),
+                              'sveltish.aio.AsyncStore.subscribe': ('aio.html#asyncstore.subscribe', 'sveltish/aio.py'),
+                              'sveltish.aio.AsyncStore.update': ('aio.html#asyncstore.update', 'sveltish/aio.py'),
+                              'sveltish.aio.Subscription': ('aio.html#subscription', 'sveltish/aio.py'),
+                              'sveltish.aio.Subscription.__init__': ('aio.html#subscription.__init__', 'sveltish/aio.py'),
+                              'sveltish.aio.Subscription.cancel': ('aio.html#subscription.cancel', 'sveltish/aio.py'),
+                              'sveltish.aio.Subscription.deliver': ('aio.html#subscription.deliver', 'sveltish/aio.py'),
+                              'sveltish.aio.Subscription.join': ('aio.html#subscription.join', 'sveltish/aio.py'),
+                              'sveltish.aio.Subscription.put': ('aio.html#subscription.put', 'sveltish/aio.py'),
+                              'sveltish.aio.Subscription.put_nowait': ('aio.html#subscription.put_nowait', 'sveltish/aio.py'),
+                              'sveltish.aio.call': ('aio.html#call', 'sveltish/aio.py'),
+                              'sveltish.aio.derived': ('aio.html#derived', 'sveltish/aio.py'),
+                              'sveltish.aio.readable': ('aio.html#readable', 'sveltish/aio.py'),
+                              'sveltish.aio.writable': ('aio.html#writable', 'sveltish/aio.py')},
+            'sveltish.arrays': { 'sveltish.arrays.ArrayStore': ('arrays.html#arraystore', 'sveltish/arrays.py'),
+                                 'sveltish.arrays.ArrayStore.__getitem__': ('arrays.html#arraystore.__getitem__', 'sveltish/arrays.py'),
+                                 'sveltish.arrays.ArrayStore.__init__': ('arrays.html#arraystore.__init__', 'sveltish/arrays.py'),
+                                 'sveltish.arrays.ArrayStore.__repr__': ('arrays.html#arraystore.__repr__', 'sveltish/arrays.py'),
+                                 'sveltish.arrays.ArrayStore.__setitem__': ('arrays.html#arraystore.__setitem__', 'sveltish/arrays.py'),
+                                 'sveltish.arrays.ArrayStore.merge': ('arrays.html#arraystore.merge', 'sveltish/arrays.py'),
+                                 'sveltish.arrays.ArrayStore.set': ('arrays.html#arraystore.set', 'sveltish/arrays.py'),
+                                 'sveltish.arrays.ElementwiseStore': ('arrays.html#elementwisestore', 'sveltish/arrays.py'),
+                                 'sveltish.arrays.ElementwiseStore.__init__': ( 'arrays.html#elementwisestore.__init__',
+                                                                                'sveltish/arrays.py'),
+                                 'sveltish.arrays.ElementwiseStore.__setitem__': ( 'arrays.html#elementwisestore.__setitem__',
+                                                                                   'sveltish/arrays.py'),
+                                 'sveltish.arrays.ElementwiseStore.invalidate': ( 'arrays.html#elementwisestore.invalidate',
+                                                                                  'sveltish/arrays.py'),
+                                 'sveltish.arrays.ElementwiseStore.recompute': ( 'arrays.html#elementwisestore.recompute',
+                                                                                 'sveltish/arrays.py'),
+                                 'sveltish.arrays.ElementwiseStore.set': ('arrays.html#elementwisestore.set', 'sveltish/arrays.py'),
+                                 'sveltish.arrays.ElementwiseStore.update': ('arrays.html#elementwisestore.update', 'sveltish/arrays.py'),
+                                 'sveltish.arrays.elementwise': ('arrays.html#elementwise', 'sveltish/arrays.py')},
+            'sveltish.instrument': { 'sveltish.instrument.Event': ('instrument.html#event', 'sveltish/instrument.py'),
+                                     'sveltish.instrument.Hooks': ('instrument.html#hooks', 'sveltish/instrument.py'),
+                                     'sveltish.instrument.Hooks.__init__': ('instrument.html#hooks.__init__', 'sveltish/instrument.py'),
+                                     'sveltish.instrument.Hooks.add': ('instrument.html#hooks.add', 'sveltish/instrument.py'),
+                                     'sveltish.instrument.Hooks.emit': ('instrument.html#hooks.emit', 'sveltish/instrument.py'),
+                                     'sveltish.instrument.LeakCheck': ('instrument.html#leakcheck', 'sveltish/instrument.py'),
+                                     'sveltish.instrument.LeakCheck.__enter__': ( 'instrument.html#leakcheck.__enter__',
+                                                                                  'sveltish/instrument.py'),
+                                     'sveltish.instrument.LeakCheck.__exit__': ( 'instrument.html#leakcheck.__exit__',
+                                                                                 'sveltish/instrument.py'),
+                                     'sveltish.instrument.Profiler': ('instrument.html#profiler', 'sveltish/instrument.py'),
+                                     'sveltish.instrument.Profiler.__call__': ( 'instrument.html#profiler.__call__',
+                                                                                'sveltish/instrument.py'),
+                                     'sveltish.instrument.Profiler.__exit__': ( 'instrument.html#profiler.__exit__',
+                                                                                'sveltish/instrument.py'),
+                                     'sveltish.instrument.Profiler.__init__': ( 'instrument.html#profiler.__init__',
+                                                                                'sveltish/instrument.py'),
+                                     'sveltish.instrument.Profiler.report': ('instrument.html#profiler.report', 'sveltish/instrument.py'),
+                                     'sveltish.instrument.Profiler.start': ('instrument.html#profiler.start', 'sveltish/instrument.py'),
+                                     'sveltish.instrument.Profiler.stop': ('instrument.html#profiler.stop', 'sveltish/instrument.py'),
+                                     'sveltish.instrument.Stats': ('instrument.html#stats', 'sveltish/instrument.py'),
+                                     'sveltish.instrument.Stats.__init__': ('instrument.html#stats.__init__', 'sveltish/instrument.py'),
+                                     'sveltish.instrument.Stats.__repr__': ('instrument.html#stats.__repr__', 'sveltish/instrument.py'),
+                                     'sveltish.instrument.census': ('instrument.html#census', 'sveltish/instrument.py'),
+                                     'sveltish.instrument.depth': ('instrument.html#depth', 'sveltish/instrument.py'),
+                                     'sveltish.instrument.node_of': ('instrument.html#node_of', 'sveltish/instrument.py'),
+                                     'sveltish.instrument.sources': ('instrument.html#sources', 'sveltish/instrument.py'),
+                                     'sveltish.instrument.subscribers': ('instrument.html#subscribers', 'sveltish/instrument.py')},
+            'sveltish.keyed': { 'sveltish.keyed.KeyedStore': ('keyed.html#keyedstore', 'sveltish/keyed.py'),
+                                'sveltish.keyed.KeyedStore.__contains__': ('keyed.html#keyedstore.__contains__', 'sveltish/keyed.py'),
+                                'sveltish.keyed.KeyedStore.__delitem__': ('keyed.html#keyedstore.__delitem__', 'sveltish/keyed.py'),
+                                'sveltish.keyed.KeyedStore.__getitem__': ('keyed.html#keyedstore.__getitem__', 'sveltish/keyed.py'),
+                                'sveltish.keyed.KeyedStore.__init__': ('keyed.html#keyedstore.__init__', 'sveltish/keyed.py'),
+                                'sveltish.keyed.KeyedStore.__setitem__': ('keyed.html#keyedstore.__setitem__', 'sveltish/keyed.py'),
+                                'sveltish.keyed.KeyedStore.apply': ('keyed.html#keyedstore.apply', 'sveltish/keyed.py'),
+                                'sveltish.keyed.KeyedStore.assign': ('keyed.html#keyedstore.assign', 'sveltish/keyed.py'),
+                                'sveltish.keyed.KeyedStore.items': ('keyed.html#keyedstore.items', 'sveltish/keyed.py'),
+                                'sveltish.keyed.KeyedStore.map_items': ('keyed.html#keyedstore.map_items', 'sveltish/keyed.py'),
+                                'sveltish.keyed.KeyedStore.merge': ('keyed.html#keyedstore.merge', 'sveltish/keyed.py'),
+                                'sveltish.keyed.KeyedStore.pairs': ('keyed.html#keyedstore.pairs', 'sveltish/keyed.py'),
+                                'sveltish.keyed.KeyedStore.patch': ('keyed.html#keyedstore.patch', 'sveltish/keyed.py'),
+                                'sveltish.keyed.KeyedStore.set': ('keyed.html#keyedstore.set', 'sveltish/keyed.py'),
+                                'sveltish.keyed.ListStore': ('keyed.html#liststore', 'sveltish/keyed.py'),
+                                'sveltish.keyed.ListStore.__contains__': ('keyed.html#liststore.__contains__', 'sveltish/keyed.py'),
+                                'sveltish.keyed.ListStore.__getitem__': ('keyed.html#liststore.__getitem__', 'sveltish/keyed.py'),
+                                'sveltish.keyed.ListStore.__init__': ('keyed.html#liststore.__init__', 'sveltish/keyed.py'),
+                                'sveltish.keyed.ListStore.__reindex': ('keyed.html#liststore.__reindex', 'sveltish/keyed.py'),
+                                'sveltish.keyed.ListStore.__repr__': ('keyed.html#liststore.__repr__', 'sveltish/keyed.py'),
+                                'sveltish.keyed.ListStore.append': ('keyed.html#liststore.append', 'sveltish/keyed.py'),
+                                'sveltish.keyed.ListStore.apply': ('keyed.html#liststore.apply', 'sveltish/keyed.py'),
+                                'sveltish.keyed.ListStore.assign': ('keyed.html#liststore.assign', 'sveltish/keyed.py'),
+                                'sveltish.keyed.ListStore.check': ('keyed.html#liststore.check', 'sveltish/keyed.py'),
+                                'sveltish.keyed.ListStore.insert': ('keyed.html#liststore.insert', 'sveltish/keyed.py'),
+                                'sveltish.keyed.ListStore.items': ('keyed.html#liststore.items', 'sveltish/keyed.py'),
+                                'sveltish.keyed.ListStore.move': ('keyed.html#liststore.move', 'sveltish/keyed.py'),
+                                'sveltish.keyed.ListStore.pairs': ('keyed.html#liststore.pairs', 'sveltish/keyed.py'),
+                                'sveltish.keyed.ListStore.remove': ('keyed.html#liststore.remove', 'sveltish/keyed.py'),
+                                'sveltish.keyed.MapStore': ('keyed.html#mapstore', 'sveltish/keyed.py'),
+                                'sveltish.keyed.MapStore.__contains__': ('keyed.html#mapstore.__contains__', 'sveltish/keyed.py'),
+                                'sveltish.keyed.MapStore.__getitem__': ('keyed.html#mapstore.__getitem__', 'sveltish/keyed.py'),
+                                'sveltish.keyed.MapStore.__init__': ('keyed.html#mapstore.__init__', 'sveltish/keyed.py'),
+                                'sveltish.keyed.MapStore.__repr__': ('keyed.html#mapstore.__repr__', 'sveltish/keyed.py'),
+                                'sveltish.keyed.MapStore.apply': ('keyed.html#mapstore.apply', 'sveltish/keyed.py'),
+                                'sveltish.keyed.MapStore.assign': ('keyed.html#mapstore.assign', 'sveltish/keyed.py'),
+                                'sveltish.keyed.MapStore.items': ('keyed.html#mapstore.items', 'sveltish/keyed.py'),
+                                'sveltish.keyed.MapStore.pairs': ('keyed.html#mapstore.pairs', 'sveltish/keyed.py'),
+                                'sveltish.keyed.MappedItems': ('keyed.html#mappeditems', 'sveltish/keyed.py'),
+                                'sveltish.keyed.MappedItems.__init__': ('keyed.html#mappeditems.__init__', 'sveltish/keyed.py'),
+                                'sveltish.keyed.MappedItems.check': ('keyed.html#mappeditems.check', 'sveltish/keyed.py'),
+                                'sveltish.keyed.MappedItems.invalidate': ('keyed.html#mappeditems.invalidate', 'sveltish/keyed.py'),
+                                'sveltish.keyed.MappedItems.pairs': ('keyed.html#mappeditems.pairs', 'sveltish/keyed.py'),
+                                'sveltish.keyed.MappedItems.patch': ('keyed.html#mappeditems.patch', 'sveltish/keyed.py'),
+                                'sveltish.keyed.MappedItems.recompute': ('keyed.html#mappeditems.recompute', 'sveltish/keyed.py'),
+                                'sveltish.keyed.MappedItems.set': ('keyed.html#mappeditems.set', 'sveltish/keyed.py'),
+                                'sveltish.keyed.MappedList': ('keyed.html#mappedlist', 'sveltish/keyed.py'),
+                                'sveltish.keyed.MappedMap': ('keyed.html#mappedmap', 'sveltish/keyed.py'),
+                                'sveltish.keyed.Op': ('keyed.html#op', 'sveltish/keyed.py')},
+            'sveltish.persist': { 'sveltish.persist.ChangeLog': ('persist.html#changelog', 'sveltish/persist.py'),
+                                  'sveltish.persist.ChangeLog.__enter__': ('persist.html#changelog.__enter__', 'sveltish/persist.py'),
+                                  'sveltish.persist.ChangeLog.__exit__': ('persist.html#changelog.__exit__', 'sveltish/persist.py'),
+                                  'sveltish.persist.ChangeLog.__init__': ('persist.html#changelog.__init__', 'sveltish/persist.py'),
+                                  'sveltish.persist.ChangeLog.append': ('persist.html#changelog.append', 'sveltish/persist.py'),
+                                  'sveltish.persist.ChangeLog.attach': ('persist.html#changelog.attach', 'sveltish/persist.py'),
+                                  'sveltish.persist.ChangeLog.close': ('persist.html#changelog.close', 'sveltish/persist.py'),
+                                  'sveltish.persist.ChangeLog.flush': ('persist.html#changelog.flush', 'sveltish/persist.py'),
+                                  'sveltish.persist._complete': ('persist.html#_complete', 'sveltish/persist.py'),
+                                  'sveltish.persist._raw': ('persist.html#_raw', 'sveltish/persist.py'),
+                                  'sveltish.persist.load': ('persist.html#load', 'sveltish/persist.py'),
+                                  'sveltish.persist.replay': ('persist.html#replay', 'sveltish/persist.py'),
+                                  'sveltish.persist.restore': ('persist.html#restore', 'sveltish/persist.py'),
+                                  'sveltish.persist.snapshot': ('persist.html#snapshot', 'sveltish/persist.py')},
+            'sveltish.propagation': { 'sveltish.propagation.Propagation': ('propagation.html#propagation', 'sveltish/propagation.py'),
+                                      'sveltish.propagation.Propagation.__init__': ( 'propagation.html#propagation.__init__',
+                                                                                     'sveltish/propagation.py'),
+                                      'sveltish.propagation.Propagation.close_tick': ( 'propagation.html#propagation.close_tick',
+                                                                                       'sveltish/propagation.py'),
+                                      'sveltish.propagation.Propagation.commit': ( 'propagation.html#propagation.commit',
+                                                                                   'sveltish/propagation.py'),
+                                      'sveltish.propagation.Propagation.defer': ( 'propagation.html#propagation.defer',
+                                                                                  'sveltish/propagation.py'),
+                                      'sveltish.propagation.Propagation.drain': ( 'propagation.html#propagation.drain',
+                                                                                  'sveltish/propagation.py'),
+                                      'sveltish.propagation.Propagation.flush': ( 'propagation.html#propagation.flush',
+                                                                                  'sveltish/propagation.py'),
+                                      'sveltish.propagation.Propagation.open_tick': ( 'propagation.html#propagation.open_tick',
+                                                                                      'sveltish/propagation.py'),
+                                      'sveltish.propagation.Propagation.schedule': ( 'propagation.html#propagation.schedule',
+                                                                                     'sveltish/propagation.py'),
+                                      'sveltish.propagation.batch': ('propagation.html#batch', 'sveltish/propagation.py'),
+                                      'sveltish.propagation.next_tick': ('propagation.html#next_tick', 'sveltish/propagation.py'),
+                                      'sveltish.propagation.set_scheduler': ('propagation.html#set_scheduler', 'sveltish/propagation.py')},
+            'sveltish.signals': { 'sveltish.signals.Callback': ('signals.html#callback', 'sveltish/signals.py'),
                                   'sveltish.signals.Callback.__init__': ('signals.html#callback.__init__', 'sveltish/signals.py'),
+                                  'sveltish.signals.Callback.cancel': ('signals.html#callback.cancel', 'sveltish/signals.py'),
+                                  'sveltish.signals.Callback.run': ('signals.html#callback.run', 'sveltish/signals.py'),
+                                  'sveltish.signals.Computed': ('signals.html#computed', 'sveltish/signals.py'),
+                                  'sveltish.signals.Computed.__init__': ('signals.html#computed.__init__', 'sveltish/signals.py'),
+                                  'sveltish.signals.Computed.cancel': ('signals.html#computed.cancel', 'sveltish/signals.py'),
+                                  'sveltish.signals.Computed.land': ('signals.html#computed.land', 'sveltish/signals.py'),
+                                  'sveltish.signals.Computed.read': ('signals.html#computed.read', 'sveltish/signals.py'),
+                                  'sveltish.signals.Computed.run': ('signals.html#computed.run', 'sveltish/signals.py'),
                                   'sveltish.signals.Observable': ('signals.html#observable', 'sveltish/signals.py'),
                                   'sveltish.signals.Observable.subscribe': ('signals.html#observable.subscribe', 'sveltish/signals.py'),
                                   'sveltish.signals.Observer': ('signals.html#observer', 'sveltish/signals.py'),
                                   'sveltish.signals.Observer.cancel': ('signals.html#observer.cancel', 'sveltish/signals.py'),
                                   'sveltish.signals.Observer.run': ('signals.html#observer.run', 'sveltish/signals.py'),
+                                  'sveltish.signals.Reaction': ('signals.html#reaction', 'sveltish/signals.py'),
+                                  'sveltish.signals.Reaction.__init__': ('signals.html#reaction.__init__', 'sveltish/signals.py'),
+                                  'sveltish.signals.Reaction.cancel': ('signals.html#reaction.cancel', 'sveltish/signals.py'),
+                                  'sveltish.signals.Reaction.run': ('signals.html#reaction.run', 'sveltish/signals.py'),
                                   'sveltish.signals.Readable': ('signals.html#readable', 'sveltish/signals.py'),
-                                  'sveltish.signals.Readable.__init__': ('signals.html#readable.__init__', 'sveltish/signals.py'),
                                   'sveltish.signals.Readable.__repr__': ('signals.html#readable.__repr__', 'sveltish/signals.py'),
                                   'sveltish.signals.Readable.asTuple': ('signals.html#readable.astuple', 'sveltish/signals.py'),
+                                  'sveltish.signals.Readable.read': ('signals.html#readable.read', 'sveltish/signals.py'),
+                                  'sveltish.signals.Readers': ('signals.html#readers', 'sveltish/signals.py'),
+                                  'sveltish.signals.Readers.__init__': ('signals.html#readers.__init__', 'sveltish/signals.py'),
                                   'sveltish.signals.Signal': ('signals.html#signal', 'sveltish/signals.py'),
                                   'sveltish.signals.Signal.__init__': ('signals.html#signal.__init__', 'sveltish/signals.py'),
+                                  'sveltish.signals.Signal.notify': ('signals.html#signal.notify', 'sveltish/signals.py'),
+                                  'sveltish.signals.Signal.read': ('signals.html#signal.read', 'sveltish/signals.py'),
+                                  'sveltish.signals.Signal.subscribe': ('signals.html#signal.subscribe', 'sveltish/signals.py'),
+                                  'sveltish.signals.Signal.unsubscribe': ('signals.html#signal.unsubscribe', 'sveltish/signals.py'),
+                                  'sveltish.signals.Signal.write': ('signals.html#signal.write', 'sveltish/signals.py'),
+                                  'sveltish.signals.WeakCallback': ('signals.html#weakcallback', 'sveltish/signals.py'),
+                                  'sveltish.signals.WeakCallback.__init__': ('signals.html#weakcallback.__init__', 'sveltish/signals.py'),
+                                  'sveltish.signals.WeakCallback.run': ('signals.html#weakcallback.run', 'sveltish/signals.py'),
                                   'sveltish.signals.Writable': ('signals.html#writable', 'sveltish/signals.py'),
-                                  'sveltish.signals.Writable.__init__': ('signals.html#writable.__init__', 'sveltish/signals.py'),
+                                  'sveltish.signals.Writable.asTuple': ('signals.html#writable.astuple', 'sveltish/signals.py'),
+                                  'sveltish.signals.Writable.write': ('signals.html#writable.write', 'sveltish/signals.py'),
                                   'sveltish.signals.computed': ('signals.html#computed', 'sveltish/signals.py'),
                                   'sveltish.signals.pipe': ('signals.html#pipe', 'sveltish/signals.py'),
                                   'sveltish.signals.reaction': ('signals.html#reaction', 'sveltish/signals.py'),
                                   'sveltish.signals.readonly': ('signals.html#readonly', 'sveltish/signals.py'),
+                                  'sveltish.signals.set_many': ('signals.html#set_many', 'sveltish/signals.py'),
                                   'sveltish.signals.signal': ('signals.html#signal', 'sveltish/signals.py'),
+                                  'sveltish.signals.track': ('signals.html#track', 'sveltish/signals.py'),
+                                  'sveltish.signals.untrack': ('signals.html#untrack', 'sveltish/signals.py'),
                                   'sveltish.signals.writable': ('signals.html#writable', 'sveltish/signals.py')},
-            'sveltish.stores': { 'sveltish.stores.DerivedStore': ('stores.html#derivedstore', 'sveltish/stores.py'),
+            'sveltish.stores': { 'sveltish.stores.ChangeStore': ('stores.html#changestore', 'sveltish/stores.py'),
+                                 'sveltish.stores.ChangeStore.__commit': ('stores.html#changestore.__commit', 'sveltish/stores.py'),
+                                 'sveltish.stores.ChangeStore.__init__': ('stores.html#changestore.__init__', 'sveltish/stores.py'),
+                                 'sveltish.stores.ChangeStore.__notify': ('stores.html#changestore.__notify', 'sveltish/stores.py'),
+                                 'sveltish.stores.ChangeStore.changed': ('stores.html#changestore.changed', 'sveltish/stores.py'),
+                                 'sveltish.stores.ChangeStore.merge': ('stores.html#changestore.merge', 'sveltish/stores.py'),
+                                 'sveltish.stores.ChangeStore.subscribe_changes': ( 'stores.html#changestore.subscribe_changes',
+                                                                                    'sveltish/stores.py'),
+                                 'sveltish.stores.DerivedStore': ('stores.html#derivedstore', 'sveltish/stores.py'),
                                  'sveltish.stores.DerivedStore.__init__': ('stores.html#derivedstore.__init__', 'sveltish/stores.py'),
+                                 'sveltish.stores.DerivedStore.connect': ('stores.html#derivedstore.connect', 'sveltish/stores.py'),
+                                 'sveltish.stores.DerivedStore.fuse': ('stores.html#derivedstore.fuse', 'sveltish/stores.py'),
                                  'sveltish.stores.DerivedStore.get': ('stores.html#derivedstore.get', 'sveltish/stores.py'),
+                                 'sveltish.stores.DerivedStore.invalidate': ('stores.html#derivedstore.invalidate', 'sveltish/stores.py'),
+                                 'sveltish.stores.DerivedStore.land': ('stores.html#derivedstore.land', 'sveltish/stores.py'),
+                                 'sveltish.stores.DerivedStore.recompute': ('stores.html#derivedstore.recompute', 'sveltish/stores.py'),
+                                 'sveltish.stores.DerivedStore.reconnect': ('stores.html#derivedstore.reconnect', 'sveltish/stores.py'),
                                  'sveltish.stores.DerivedStore.set': ('stores.html#derivedstore.set', 'sveltish/stores.py'),
                                  'sveltish.stores.DerivedStore.subscribe': ('stores.html#derivedstore.subscribe', 'sveltish/stores.py'),
                                  'sveltish.stores.DerivedStore.update': ('stores.html#derivedstore.update', 'sveltish/stores.py'),
+                                 'sveltish.stores.PathStore': ('stores.html#pathstore', 'sveltish/stores.py'),
+                                 'sveltish.stores.PathStore.__init__': ('stores.html#pathstore.__init__', 'sveltish/stores.py'),
+                                 'sveltish.stores.PathStore.__repr__': ('stores.html#pathstore.__repr__', 'sveltish/stores.py'),
+                                 'sveltish.stores.PathStore.get': ('stores.html#pathstore.get', 'sveltish/stores.py'),
+                                 'sveltish.stores.PathStore.set': ('stores.html#pathstore.set', 'sveltish/stores.py'),
+                                 'sveltish.stores.PathStore.unchanged': ('stores.html#pathstore.unchanged', 'sveltish/stores.py'),
                                  'sveltish.stores.ReadableStore': ('stores.html#readablestore', 'sveltish/stores.py'),
                                  'sveltish.stores.ReadableStore.__init__': ('stores.html#readablestore.__init__', 'sveltish/stores.py'),
                                  'sveltish.stores.ReadableStore.__repr__': ('stores.html#readablestore.__repr__', 'sveltish/stores.py'),
                                  'sveltish.stores.ReadableStore.set': ('stores.html#readablestore.set', 'sveltish/stores.py'),
                                  'sveltish.stores.ReadableStore.update': ('stores.html#readablestore.update', 'sveltish/stores.py'),
                                  'sveltish.stores.Store': ('stores.html#store', 'sveltish/stores.py'),
+                                 'sveltish.stores.Store.__commit': ('stores.html#store.__commit', 'sveltish/stores.py'),
                                  'sveltish.stores.Store.__getattr__': ('stores.html#store.__getattr__', 'sveltish/stores.py'),
                                  'sveltish.stores.Store.__init__': ('stores.html#store.__init__', 'sveltish/stores.py'),
+                                 'sveltish.stores.Store.__init_subclass__': ('stores.html#store.__init_subclass__', 'sveltish/stores.py'),
                                  'sveltish.stores.Store.__len__': ('stores.html#store.__len__', 'sveltish/stores.py'),
+                                 'sveltish.stores.Store.__notify': ('stores.html#store.__notify', 'sveltish/stores.py'),
                                  'sveltish.stores.Store.__repr__': ('stores.html#store.__repr__', 'sveltish/stores.py'),
                                  'sveltish.stores.Store.__set': ('stores.html#store.__set', 'sveltish/stores.py'),
                                  'sveltish.stores.Store.__setattr__': ('stores.html#store.__setattr__', 'sveltish/stores.py'),
@@ -54,14 +266,60 @@ d = { 'settings': { 'branch': 'main',
                                  'sveltish.stores.Writable.set': ('stores.html#writable.set', 'sveltish/stores.py'),
                                  'sveltish.stores.Writable.update': ('stores.html#writable.update', 'sveltish/stores.py'),
                                  'sveltish.stores.__or__': ('stores.html#__or__', 'sveltish/stores.py'),
+                                 'sveltish.stores.at': ('stores.html#at', 'sveltish/stores.py'),
                                  'sveltish.stores.derived': ('stores.html#derived', 'sveltish/stores.py'),
                                  'sveltish.stores.pipe': ('stores.html#pipe', 'sveltish/stores.py'),
                                  'sveltish.stores.readable': ('stores.html#readable', 'sveltish/stores.py'),
+                                 'sveltish.stores.select': ('stores.html#select', 'sveltish/stores.py'),
+                                 'sveltish.stores.set_many': ('stores.html#set_many', 'sveltish/stores.py'),
                                  'sveltish.stores.writable': ('stores.html#writable', 'sveltish/stores.py')},
+            'sveltish.streams': { 'sveltish.streams.IterableStore': ('streams.html#iterablestore', 'sveltish/streams.py'),
+                                  'sveltish.streams.IterableStore.__init__': ('streams.html#iterablestore.__init__', 'sveltish/streams.py'),
+                                  'sveltish.streams.IterableStore.read': ('streams.html#iterablestore.read', 'sveltish/streams.py'),
+                                  'sveltish.streams.IterableStore.subscribe': ( 'streams.html#iterablestore.subscribe',
+                                                                                'sveltish/streams.py'),
+                                  'sveltish.streams.astream': ('streams.html#astream', 'sveltish/streams.py'),
+                                  'sveltish.streams.from_async_iter': ('streams.html#from_async_iter', 'sveltish/streams.py'),
+                                  'sveltish.streams.from_iterable': ('streams.html#from_iterable', 'sveltish/streams.py'),
+                                  'sveltish.streams.stream': ('streams.html#stream', 'sveltish/streams.py')},
             'sveltish.utils': { 'sveltish.utils.Bunch': ('utils.html#bunch', 'sveltish/utils.py'),
+                                'sveltish.utils.KeyEqual': ('utils.html#keyequal', 'sveltish/utils.py'),
+                                'sveltish.utils.KeyEqual.__call__': ('utils.html#keyequal.__call__', 'sveltish/utils.py'),
+                                'sveltish.utils.KeyEqual.__init__': ('utils.html#keyequal.__init__', 'sveltish/utils.py'),
+                                'sveltish.utils.KeyEqual.prime': ('utils.html#keyequal.prime', 'sveltish/utils.py'),
+                                'sveltish.utils.Latest': ('utils.html#latest', 'sveltish/utils.py'),
+                                'sveltish.utils.Latest.__init__': ('utils.html#latest.__init__', 'sveltish/utils.py'),
+                                'sveltish.utils.Latest.cancel': ('utils.html#latest.cancel', 'sveltish/utils.py'),
+                                'sveltish.utils.Latest.submit': ('utils.html#latest.submit', 'sveltish/utils.py'),
+                                'sveltish.utils.Link': ('utils.html#link', 'sveltish/utils.py'),
+                                'sveltish.utils.Link.__init__': ('utils.html#link.__init__', 'sveltish/utils.py'),
                                 'sveltish.utils.NamedBunch': ('utils.html#namedbunch', 'sveltish/utils.py'),
                                 'sveltish.utils.NamedBunch.__init__': ('utils.html#namedbunch.__init__', 'sveltish/utils.py'),
+                                'sveltish.utils.Stages': ('utils.html#stages', 'sveltish/utils.py'),
+                                'sveltish.utils.Stages.__call__': ('utils.html#stages.__call__', 'sveltish/utils.py'),
+                                'sveltish.utils.Stages.__init__': ('utils.html#stages.__init__', 'sveltish/utils.py'),
+                                'sveltish.utils.Subscribers': ('utils.html#subscribers', 'sveltish/utils.py'),
+                                'sveltish.utils.Subscribers.__bool__': ('utils.html#subscribers.__bool__', 'sveltish/utils.py'),
+                                'sveltish.utils.Subscribers.__init__': ('utils.html#subscribers.__init__', 'sveltish/utils.py'),
+                                'sveltish.utils.Subscribers.__iter__': ('utils.html#subscribers.__iter__', 'sveltish/utils.py'),
+                                'sveltish.utils.Subscribers.__len__': ('utils.html#subscribers.__len__', 'sveltish/utils.py'),
+                                'sveltish.utils.Subscribers.__repr__': ('utils.html#subscribers.__repr__', 'sveltish/utils.py'),
+                                'sveltish.utils.Subscribers.add': ('utils.html#subscribers.add', 'sveltish/utils.py'),
+                                'sveltish.utils.Subscribers.in_lane': ('utils.html#subscribers.in_lane', 'sveltish/utils.py'),
+                                'sveltish.utils.Subscribers.lanes': ('utils.html#subscribers.lanes', 'sveltish/utils.py'),
+                                'sveltish.utils.Subscribers.remove': ('utils.html#subscribers.remove', 'sveltish/utils.py'),
+                                'sveltish.utils._digest': ('utils.html#_digest', 'sveltish/utils.py'),
+                                'sveltish.utils.apply': ('utils.html#apply', 'sveltish/utils.py'),
+                                'sveltish.utils.array_equal': ('utils.html#array_equal', 'sveltish/utils.py'),
+                                'sveltish.utils.assoc_in': ('utils.html#assoc_in', 'sveltish/utils.py'),
                                 'sveltish.utils.compose': ('utils.html#compose', 'sveltish/utils.py'),
+                                'sveltish.utils.fingerprint': ('utils.html#fingerprint', 'sveltish/utils.py'),
+                                'sveltish.utils.get_in': ('utils.html#get_in', 'sveltish/utils.py'),
+                                'sveltish.utils.identical': ('utils.html#identical', 'sveltish/utils.py'),
                                 'sveltish.utils.identity': ('utils.html#identity', 'sveltish/utils.py'),
                                 'sveltish.utils.noop': ('utils.html#noop', 'sveltish/utils.py'),
-                                'sveltish.utils.safe_not_equal': ('utils.html#safe_not_equal', 'sveltish/utils.py')}}}
+                                'sveltish.utils.safe_equal': ('utils.html#safe_equal', 'sveltish/utils.py'),
+                                'sveltish.utils.safe_not_equal': ('utils.html#safe_not_equal', 'sveltish/utils.py'),
+                                'sveltish.utils.structural_equal': ('utils.html#structural_equal', 'sveltish/utils.py'),
+                                'sveltish.utils.versioned': ('utils.html#versioned', 'sveltish/utils.py'),
+                                'sveltish.utils.weak': ('utils.html#weak', 'sveltish/utils.py')}}}
@@ -0,0 +1,216 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/02_aio.ipynb.
+
+# %% ../nbs/02_aio.ipynb 4
+from __future__ import annotations
+import asyncio, inspect
+from typing import Any, Awaitable, Callable, Generic, Optional, Union
+import sveltish.utils as utils
+from .stores import T, Unsubscriber, Equality
+
+# %% auto 0
+__all__ = ['AsyncSubscriber', 'AsyncNotifier', 'call', 'Subscription', 'AsyncStore', 'writable', 'AsyncReadableStore', 'readable',
+           'AsyncDerivedStore', 'derived']
+
+# %% ../nbs/02_aio.ipynb 5
+AsyncSubscriber = Callable[[T], Union[None, Awaitable[None]]] # a callback or a coroutine function
+AsyncNotifier = Callable[[Callable], Union[Unsubscriber, None, Awaitable[None]]] # a Notifier or an async producer
+
+async def call(fn: Callable, *args) -> Any:
+    ''' Calls `fn`, awaiting the result if it is awaitable.'''
+    result = fn(*args)
+    return (await result) if inspect.isawaitable(result) else result
+
+# %% ../nbs/02_aio.ipynb 6
+class Subscription:
+    ''' A subscriber with its own buffer and delivery task.'''
+    def __init__(self,
+                 callback: AsyncSubscriber, # callback or coroutine function called with each value
+                 maxsize: int, # size of the buffer, 0 for unbounded
+                 semaphore: Optional[asyncio.Semaphore] # bounds the number of subscribers running at once
+                 ) -> None:
+        self.callback = callback
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.semaphore = semaphore
+        self.task = asyncio.get_running_loop().create_task(self.deliver())
+
+    async def deliver(self) -> None:
+        ''' Calls the callback with each buffered value, in order.'''
+        while True:
+            value = await self.queue.get()
+            try:
+                if self.semaphore:
+                    async with self.semaphore: await call(self.callback, value)
+                else: await call(self.callback, value)
+            except Exception as error: # a failing subscriber must not stop the delivery
+                asyncio.get_running_loop().call_exception_handler({'message': 'Exception in store subscriber', 'exception': error})
+            finally: self.queue.task_done()
+
+    async def put(self, value) -> None:
+        ''' Buffers `value`, waiting while the buffer is full. Gives up when the subscription is cancelled.'''
+        if self.task.done(): return
+        if not self.queue.full(): return self.queue.put_nowait(value)
+        put = asyncio.ensure_future(self.queue.put(value))
+        await asyncio.wait((put, self.task), return_when=asyncio.FIRST_COMPLETED)
+        if not put.done(): put.cancel() # cancelled while waiting: the value is dropped
+
+    def put_nowait(self, value) -> None:
+        ''' Buffers `value`, dropping the oldest buffered value if the buffer is full.'''
+        if self.queue.full(): self.queue.get_nowait(); self.queue.task_done()
+        self.queue.put_nowait(value)
+
+    async def join(self) -> None:
+        ''' Waits until the buffered values are delivered, or the subscription is cancelled.'''
+        joined = asyncio.ensure_future(self.queue.join())
+        try: await asyncio.wait((joined, self.task), return_when=asyncio.FIRST_COMPLETED) # a cancelled delivery never empties the buffer
+        finally: joined.cancel()
+
+    def cancel(self) -> None: self.task.cancel()
+
+# %% ../nbs/02_aio.ipynb 8
+class AsyncStore(Generic[T]):
+    ''' A Writable Store whose subscribers are notified through the event loop.'''
+    def __init__(self,
+                 initial_value: Any = None, # initial value of the store
+                 start: AsyncNotifier = utils.noop, # A Notifier or an async producer (Optional)
+                 equals: Equality = utils.safe_equal, # Equality policy deciding whether a new value is a change
+                 maxsize: int = 16, # size of each subscriber's buffer, 0 for unbounded
+                 concurrency: Optional[int] = None # maximum number of subscribers running at once, None for no limit
+                 ) -> None:
+        self.value = initial_value
+        self.subscribers: dict = {} # Subscriptions, in subscription order
+        self.start = start # function called when the first subscriber is added
+        self.stop: Optional[Unsubscriber] = None # function called when the last subscriber is removed
+        self.equals = equals
+        self.maxsize = maxsize
+        self.concurrency = concurrency
+        self.semaphore: Optional[asyncio.Semaphore] = None # created with the first subscription, inside the event loop
+
+    def get(self) -> T: return self.value
+    __call__ = get
+
+    def subscribe(self,
+                  callback: AsyncSubscriber # callback or coroutine function called when the store value changes
+                  ) -> Unsubscriber:
+        ''' Adds callback to the subscribers. Must be called from a running event loop.'''
+        if self.concurrency and not self.semaphore: self.semaphore = asyncio.Semaphore(self.concurrency)
+        subscription = Subscription(callback, self.maxsize, self.semaphore)
+        self.subscribers[subscription] = None
+        if (len(self.subscribers) == 1):
+            self.stop = self.__start()
+        subscription.put_nowait(self.value)
+        def unsubscribe() -> None:
+            ''' Removes callback from the subscribers, dropping the values it has not received yet.'''
+            if subscription not in self.subscribers: return
+            del self.subscribers[subscription]
+            subscription.cancel()
+            if (len(self.subscribers) == 0):
+                self.stop() if self.stop else None
+                self.stop = None
+        return unsubscribe
+
+    def __start(self) -> Unsubscriber:
+        ''' Calls `start`. An async producer runs as a task, cancelled by the returned function.'''
+        if inspect.iscoroutinefunction(self.start):
+            return asyncio.get_running_loop().create_task(self.start(self.__set)).cancel
+        return self.start(self.__set_nowait) or utils.noop
+
+    async def __set(self, new_value: T) -> None:
+        ''' Internal implementation of set, also passed to async producers.'''
+        if self.equals(self.value, new_value): return
+        self.value = new_value
+        for subscription in list(self.subscribers):
+            if subscription in self.subscribers: await subscription.put(new_value) # unless unsubscribed while waiting
+
+    def __set_nowait(self, new_value: T) -> None:
+        ''' Internal implementation of set_nowait, also passed to synchronous Notifiers.'''
+        if self.equals(self.value, new_value): return
+        self.value = new_value
+        for subscription in self.subscribers: subscription.put_nowait(new_value)
+
+    async def set(self, new_value: T) -> None:
+        ''' Set value of store, waiting while a subscriber's buffer is full.'''
+        await self.__set(new_value)
+
+    def set_nowait(self, new_value: T) -> None:
+        ''' Set value of store without waiting: full buffers drop their oldest value.'''
+        self.__set_nowait(new_value)
+
+    async def update(self, fn: Callable[[T], T]) -> None:
+        ''' Update the store value by applying `fn` to the existing value.'''
+        await self.set(fn(self.value))
+
+    async def join(self) -> None:
+        ''' Waits until every subscriber has received the values set so far.'''
+        await asyncio.gather(*(s.join() for s in self.subscribers))
+
+    def __len__(self) -> int: return len(self.subscribers)
+    def __repr__(self) -> str: return f"aw<{len(self)}> ${self.value.__class__.__name__}: {self.value.__repr__()}"
+
+# %% ../nbs/02_aio.ipynb 9
+def writable(value: T = None, # initial value of the store
+             start: AsyncNotifier = utils.noop, # Optional Notifier or async producer
+             equals: Equality = utils.safe_equal, # Equality policy, see `utils.safe_equal`
+             maxsize: int = 16, # size of each subscriber's buffer, 0 for unbounded
+             concurrency: Optional[int] = None # maximum number of subscribers running at once
+             ) -> AsyncStore[T]:
+    ''' Creates a new async Writable Store.'''
+    return AsyncStore(value, start, equals, maxsize, concurrency)
+
+# %% ../nbs/02_aio.ipynb 15
+class AsyncReadableStore(AsyncStore[T]):
+    ''' An async Readable Store.'''
+    async def set(self, *args, **kwargs): raise Exception("Cannot set a Readable Store.")
+    def set_nowait(self, *args, **kwargs): raise Exception("Cannot set a Readable Store.")
+    async def update(self, *args, **kwargs): raise Exception("Cannot update a Readable Store.")
+    def __repr__(self) -> str: return "ar" + super().__repr__()[2:]
+
+def readable(value: T, # initial value of the store
+             start: AsyncNotifier, # Notifier or async producer, called when the first subscriber is added
+             equals: Equality = utils.safe_equal, # Equality policy, see `utils.safe_equal`
+             maxsize: int = 16, # size of each subscriber's buffer, 0 for unbounded
+             concurrency: Optional[int] = None # maximum number of subscribers running at once
+             ) -> AsyncReadableStore[T]:
+    ''' Creates a new async Readable Store.'''
+    return AsyncReadableStore(value, start, equals, maxsize, concurrency)
+
+# %% ../nbs/02_aio.ipynb 21
+class AsyncDerivedStore(AsyncReadableStore[T]):
+    ''' An async Derived Store.'''
+    def __init__(self,
+                 s: Union[AsyncStore, list[AsyncStore]], # source store(s)
+                 fn: Callable, # callback or coroutine function that takes the source values and returns the derived value
+                 equals: Equality = utils.safe_equal, # Equality policy of the derived value
+                 maxsize: int = 16, # size of each subscriber's buffer, 0 for unbounded
+                 concurrency: Optional[int] = None # maximum number of subscribers running at once
+                 ) -> None:
+        self.sources = tuple(s) if isinstance(s, (list, tuple)) else (s,)
+        if not all(isinstance(x, AsyncStore) for x in self.sources):
+            raise Exception("s must be an AsyncStore or a list of AsyncStores")
+        self.fn = fn
+        self.task: Optional[asyncio.Task] = None # the running recomputation
+        initial = None if inspect.iscoroutinefunction(fn) else fn(*(x.get() for x in self.sources))
+        super().__init__(initial, self.produce, equals, maxsize, concurrency)
+
+    async def produce(self, set_fn: Callable) -> None:
+        ''' Async producer: recomputes the value whenever a source changes, until cancelled.'''
+        def invalidate(x=None): # x is ignored
+            if self.task: self.task.cancel() # superseded
+            self.task = asyncio.get_running_loop().create_task(self.recompute(set_fn))
+        unsubscribers = [s.subscribe(invalidate) for s in self.sources]
+        try: await asyncio.get_running_loop().create_future() # runs until cancelled
+        finally:
+            for unsubscribe in unsubscribers: unsubscribe()
+            if self.task: self.task.cancel()
+
+    async def recompute(self, set_fn: Callable) -> None:
+        ''' Applies `fn` to the current values of the sources and sets the value.'''
+        await set_fn(await call(self.fn, *(s.get() for s in self.sources)))
+
+def derived(s: Union[AsyncStore, list[AsyncStore]], # source store(s)
+            fn: Callable, # callback or coroutine function that takes the source values and returns the derived value
+            equals: Equality = utils.safe_equal, # Equality policy of the derived value
+            maxsize: int = 16, # size of each subscriber's buffer, 0 for unbounded
+            concurrency: Optional[int] = None # maximum number of subscribers running at once
+            ) -> AsyncDerivedStore[T]:
+    ''' Creates a new async Derived Store.'''
+    return AsyncDerivedStore(s, fn, equals, maxsize, concurrency)
@@ -0,0 +1,108 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/04_arrays.ipynb.
+
+# %% auto 0
+__all__ = ['ChangeSubscriber', 'ArrayStore', 'ElementwiseStore', 'elementwise']
+
+# %% ../nbs/04_arrays.ipynb 4
+import numpy as np
+from typing import Any, Callable, Union
+import sveltish.utils as utils
+from .stores import Store, ChangeStore, Notifier, Equality
+from .propagation import propagation, CRITICAL
+from .instrument import hooks, now
+
+# %% ../nbs/04_arrays.ipynb 5
+ChangeSubscriber = Callable[[np.ndarray, Any], None] # called with the array and the index of the changed elements
+
+class ArrayStore(ChangeStore[np.ndarray]):
+    ''' A Writable Store holding a NumPy array, that can be written in place. The deltas are indexes, see `stores.ChangeStore`.'''
+    __slots__ = ()
+    def __init__(self,
+                 initial_value: Any, # initial array, or anything `np.asarray` accepts
+                 start: Notifier = utils.noop, # A Notifier (Optional), its `set_fn` is the store `set`
+                 equals: Equality = utils.array_equal # Equality policy of whole arrays passed to `set`
+                 ) -> None:
+        super().__init__(np.asarray(initial_value), start, equals)
+
+    def __getitem__(self, index) -> Any: return self.value[index]
+
+    def __setitem__(self, index, value) -> None:
+        ''' Writes `value` at `index`, in place, and notifies the subscribers.'''
+        self.value[index] = value
+        self.changed(index)
+
+    def set(self,
+            new_value: Any # The new array
+            ) -> None:
+        ''' Replaces the whole array.'''
+        new_value = np.asarray(new_value)
+        if not self.equals(self.value, new_value):
+            self.value = new_value
+            self.changed()
+        elif hooks.active: hooks.emit('set', self, changed=False)
+
+    def merge(self,
+              indexes: list # indexes of the elements that changed
+              ) -> Any: # a single index covering them all
+        ''' The index itself if there is only one, `...` if one of them is `...`, else a boolean mask.'''
+        if len(indexes) == 1 or any(index is ... for index in indexes): return indexes[0] if len(indexes) == 1 else ...
+        mask = np.zeros(self.value.shape, dtype=bool)
+        for index in indexes: mask[index] = True
+        return mask
+
+    def __repr__(self) -> str: return f"a{super().__repr__()[1:]}"
+
+# %% ../nbs/04_arrays.ipynb 8
+class ElementwiseStore(ArrayStore):
+    ''' A derived array, recomputed only at the indexes that changed in its sources.'''
+    __slots__ = ('sources', 'fn', 'dirty', 'stale')
+    def __init__(self,
+                 s: Union[ArrayStore, list[ArrayStore]], # source array store(s), of the same shape
+                 fn: Callable[..., np.ndarray] # a vectorized function of the source arrays
+                 ) -> None:
+        self.sources: tuple = tuple(s) if isinstance(s, (list, tuple)) else (s,)
+        if not all(isinstance(x, ArrayStore) for x in self.sources):
+            raise Exception("s must be an ArrayStore or a list of ArrayStores")
+        self.fn = fn
+        self.dirty = False # True while queued for recomputation
+        self.stale: list = [] # indexes changed in the sources since the last recomputation
+        def start(set_fn):
+            self.dirty = True # the change subscribers are called right away with `...`: recomputed below, not queued
+            unsubscribers = [x.subscribe_changes(self.invalidate, CRITICAL) for x in self.sources] # like a derived store
+            self.dirty = False
+            self.recompute() # sync with the sources, they can have changed since creation
+            def stop():
+                self.stale.clear()
+                for unsubscribe in unsubscribers: unsubscribe()
+            return stop
+        super().__init__(fn(*[x.get() for x in self.sources]), start)
+        self.rank = 1 + max(x.rank for x in self.sources) # ranked above all its sources, see `stores.DerivedStore`
+
+    def invalidate(self,
+                   array: np.ndarray, # the source array that changed (ignored)
+                   index: Any # index of the changed elements
+                   ) -> None:
+        ''' Change subscriber of the sources: queues the recomputation of the elements at `index`.'''
+        self.stale.append(index)
+        propagation.schedule(self)
+
+    def recompute(self) -> None:
+        ''' Applies `fn` to the source elements that changed only.'''
+        if not self.stale: return # stopped while queued
+        index = self.merge(self.stale)
+        self.stale.clear()
+        started = hooks.active and now()
+        values = self.fn(*[x.get() if index is ... else x.get()[index] for x in self.sources])
+        if started: hooks.emit('recompute', self, now() - started, delta=index)
+        if index is ...: ArrayStore.set(self, values)
+        else: ArrayStore.__setitem__(self, index, values)
+
+    def set(self, *args, **kwargs): raise Exception("Cannot set an Elementwise Store.")
+    def __setitem__(self, *args, **kwargs): raise Exception("Cannot set an Elementwise Store.")
+    def update(self, *args, **kwargs): raise Exception("Cannot update an Elementwise Store.")
+
+def elementwise(s: Union[ArrayStore, list[ArrayStore]], # source array store(s), of the same shape
+                fn: Callable[..., np.ndarray] # a vectorized function of the source arrays
+                ) -> ElementwiseStore: # derived array store
+    ''' Creates a derived array store, recomputed only at the indexes that changed in its sources.'''
+    return ElementwiseStore(s, fn)
@@ -0,0 +1,177 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/06_instrument.ipynb.
+
+# %% ../nbs/06_instrument.ipynb 4
+from __future__ import annotations
+from time import perf_counter
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+# %% auto 0
+__all__ = ['hooks', 'now', 'Event', 'Hooks', 'Stats', 'Profiler', 'node_of', 'sources', 'subscribers', 'depth', 'census',
+           'LeakCheck']
+
+# %% ../nbs/06_instrument.ipynb 5
+class Event(NamedTuple):
+    ''' Something that happened to a node of the reactive graph.'''
+    kind: str # 'set', 'notify', 'recompute', 'subscribe' or 'unsubscribe'
+    node: Any # the store, signal, reaction or computed
+    duration: float # in seconds, 0 when not timed
+    info: dict # details depending on the kind
+
+class Hooks:
+    ''' The listeners of the instrumentation events.'''
+    __slots__ = ('active', 'listeners')
+    def __init__(self) -> None:
+        self.active = False # True while there are listeners, checked by the stores before reporting anything
+        self.listeners: tuple = () # copy-on-write, events can be emitted while listeners are added or removed
+
+    def add(self, listener: Callable[[Event], None]) -> Callable[[], None]:
+        ''' Adds a listener called with each event, returns a function that removes it.'''
+        self.listeners = self.listeners + (listener,)
+        self.active = True
+        def remove() -> None:
+            self.listeners = tuple(l for l in self.listeners if l is not listener)
+            self.active = bool(self.listeners)
+        return remove
+
+    def emit(self, kind: str, node: Any, duration: float = 0.0, **info) -> None:
+        ''' Calls the listeners with an `Event`.'''
+        event = Event(kind, node, duration, info)
+        for listener in self.listeners: listener(event)
+
+hooks = Hooks() # the hooks used by the stores and the signals
+
+now = perf_counter # clock of the durations
+
+# %% ../nbs/06_instrument.ipynb 10
+class Stats:
+    ''' Figures of a node, aggregated by a `Profiler`.'''
+    __slots__ = ('sets', 'redundant', 'notifications', 'fanout', 'notify_time', 'recomputes', 'recompute_time', 'subscribes', 'unsubscribes')
+    def __init__(self) -> None:
+        self.sets = self.redundant = self.notifications = self.fanout = self.recomputes = self.subscribes = self.unsubscribes = 0
+        self.notify_time = self.recompute_time = 0.0
+
+    def __repr__(self) -> str:
+        return f"Stats({', '.join(f'{k}={getattr(self, k):.6g}' for k in self.__slots__)})"
+
+class Profiler:
+    ''' Aggregates the instrumentation events per node, while it is started or used as a context manager.'''
+    def __init__(self) -> None:
+        self.stats: Dict[Any, Stats] = {} # by node
+        self.remove: Optional[Callable[[], None]] = None
+
+    def start(self) -> Profiler:
+        if not self.remove: self.remove = hooks.add(self)
+        return self
+
+    def stop(self) -> None:
+        if self.remove: self.remove()
+        self.remove = None
+
+    __enter__ = start
+    def __exit__(self, *args) -> None: self.stop()
+
+    def __call__(self, event: Event) -> None:
+        stats = self.stats.get(event.node)
+        if stats is None: stats = self.stats[event.node] = Stats()
+        kind = event.kind
+        if kind == 'set':
+            stats.sets += 1
+            if event.info['changed'] is False: stats.redundant += 1
+        elif kind == 'notify':
+            stats.notifications += 1
+            stats.notify_time += event.duration
+            stats.fanout = max(stats.fanout, event.info['fanout'])
+        elif kind == 'recompute':
+            stats.recomputes += 1
+            stats.recompute_time += event.duration
+        elif kind == 'subscribe': stats.subscribes += 1
+        elif kind == 'unsubscribe': stats.unsubscribes += 1
+
+    def report(self,
+               by: str = 'recompute_time', # a field of `Stats`
+               n: int = 10 # number of nodes
+               ) -> list: # (node, stats) pairs, highest first
+        ''' The `n` nodes with the highest `by`.'''
+        return sorted(self.stats.items(), key=lambda item: getattr(item[1], by), reverse=True)[:n]
+
+# %% ../nbs/06_instrument.ipynb 13
+def node_of(x: Any) -> Any:
+    ''' The node of the graph behind `x`: the store computed by a derived store, the computed notifying its readers...'''
+    from sveltish.stores import Store, DerivedStore
+    from sveltish.signals import Readers, WeakCallback
+    import weakref
+    if isinstance(x, Readers): return x.computed()
+    if isinstance(x, WeakCallback): return x.ref()
+    wrapped = getattr(x, '__wrapped__', None)
+    if isinstance(wrapped, weakref.ref): x = wrapped() # a weak subscription, see `utils.weak`
+    owner = getattr(x, '__self__', None) # a bound method subscribed by a node
+    if isinstance(owner, DerivedStore): return owner.target
+    if isinstance(owner, Store): return owner
+    return x
+
+def sources(node: Any) -> tuple:
+    ''' The nodes `node` depends on.'''
+    from sveltish.stores import Store, DerivedStore, PathStore
+    from sveltish.signals import Callback
+    if isinstance(node, DerivedStore): return node.sources
+    if isinstance(node, PathStore): return (node.root,)
+    if isinstance(node, Store):
+        if node.node is not None: return node.node.sources
+        return tuple(node.sources) if 'sources' in node._fields else () # an elementwise array store
+    if isinstance(node, Callback):
+        subscriptions = getattr(node, 'tracker', node).subscriptions # a weak reaction subscribes its tracker
+        return tuple(dict.fromkeys(node_of(s) for s in list(subscriptions)))
+    return ()
+
+def subscribers(node: Any) -> tuple:
+    ''' The nodes, or plain callbacks, depending on `node`.'''
+    from sveltish.stores import Store, DerivedStore
+    from sveltish.signals import Signal, Computed
+    import sveltish.utils as utils
+    if isinstance(node, DerivedStore): node = node.target
+    if isinstance(node, Computed): node = node.readers
+    if isinstance(node, Store):
+        callbacks = [*node.subscribers, *(node.changes if 'changes' in node._fields else ())]
+    elif isinstance(node, Signal): callbacks = list(node.subscribers)
+    else: return ()
+    return tuple(dict.fromkeys(node_of(c) for c in callbacks if c is not utils.noop)) # noop keeps array stores started
+
+def depth(node: Any) -> int:
+    ''' Length of the longest path from `node` to the writable nodes it depends on.'''
+    depths: Dict[int, int] = {} # by id, computed once per node: a diamond graph has exponentially many paths
+    stack = [node] # not recursive: a long chain would hit the recursion limit
+    while stack:
+        top = stack[-1]
+        if id(top) in depths:
+            stack.pop()
+            continue
+        upstream = sources(top)
+        missing = [s for s in upstream if id(s) not in depths]
+        if missing:
+            stack.extend(missing)
+            continue
+        depths[id(top)] = 1 + max(depths[id(s)] for s in upstream) if upstream else 0
+        stack.pop()
+    return depths[id(node)]
+
+# %% ../nbs/06_instrument.ipynb 18
+import gc
+from collections import Counter
+
+def census() -> Counter:
+    ''' Number of live stores, signals, callbacks and store subscriptions, by class name.'''
+    from sveltish.stores import Store
+    from sveltish.signals import Signal, Callback
+    from sveltish.utils import Link
+    gc.collect()
+    return Counter(type(o).__name__ for o in gc.get_objects() if isinstance(o, (Store, Signal, Callback, Link)))
+
+class LeakCheck:
+    ''' Context manager recording the growth of the `census` while it is open.'''
+    __slots__ = ('before', 'growth')
+    def __enter__(self) -> LeakCheck:
+        self.before, self.growth = census(), Counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.growth = census() - self.before # only the classes that grew
@@ -0,0 +1,256 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/08_keyed.ipynb.
+
+# %% ../nbs/08_keyed.ipynb 4
+from __future__ import annotations
+from typing import Any, Callable, Hashable, Iterable, Iterator, NamedTuple, Optional
+import sveltish.utils as utils
+from .stores import ChangeStore, Notifier, Equality
+from .propagation import propagation, CRITICAL
+from .instrument import hooks, now
+
+# %% auto 0
+__all__ = ['ChangeSubscriber', 'Op', 'KeyedStore', 'ListStore', 'MapStore', 'MappedItems', 'MappedList', 'MappedMap']
+
+# %% ../nbs/08_keyed.ipynb 5
+class Op(NamedTuple):
+    ''' An operation on one item of a keyed collection.'''
+    kind: str # 'insert', 'remove', 'move' or 'update'
+    key: Hashable # key of the item
+    value: Any = None # the item inserted, updated, moved or removed
+    index: Optional[int] = None # position of the item in a `ListStore`: where it is inserted, moved to, updated or removed from
+
+ChangeSubscriber = Callable[[Any, Any], None] # called with the collection and the operations applied, or `...`
+
+class KeyedStore(ChangeStore):
+    ''' Base class of the Writable Stores holding a keyed collection, see `ListStore` and `MapStore`. The deltas are lists of `Op`s, see `stores.ChangeStore`.'''
+    __slots__ = ()
+    def __init__(self,
+                 initial_value: Any, # initial collection
+                 start: Notifier = utils.noop, # A Notifier (Optional), its `set_fn` is the store `set`
+                 equals: Equality = utils.structural_equal # Equality policy of the collections passed to `set`, and of the items
+                 ) -> None:
+        super().__init__(None, start, equals)
+        self.assign(self.pairs(initial_value))
+
+    def pairs(self, collection: Any) -> Iterable[tuple]: ... # the (key, item) pairs of a collection
+    def items(self) -> Iterator[tuple]: ... # the (key, item) pairs held by the store, in order
+    def assign(self, pairs: Iterable[tuple]) -> None: ... # replaces the whole collection, without notifying
+    def apply(self, op: Op) -> Optional[Op]: ... # applies `op`, returning the operation applied or None if nothing changed
+
+    def __getitem__(self, key: Hashable) -> Any: ...
+    def __contains__(self, key: Hashable) -> bool: ...
+
+    def __setitem__(self, key: Hashable, item: Any) -> None:
+        ''' Updates the item at `key`, or inserts it if there is none.'''
+        self.patch([Op('update' if key in self else 'insert', key, item)])
+
+    def __delitem__(self, key: Hashable) -> None:
+        ''' Removes the item at `key`.'''
+        self.patch([Op('remove', key)])
+
+    def patch(self,
+              ops: Iterable[Op] # operations to apply, in order
+              ) -> None:
+        ''' Applies `ops` in place, then notifies the subscribers once.'''
+        applied = []
+        try:
+            for op in ops:
+                op = self.apply(op)
+                if op is not None: applied.append(op)
+        finally: # the operations applied before a failing one are still notified
+            if applied: self.changed(applied)
+            elif hooks.active: hooks.emit('set', self, changed=False)
+
+    def set(self,
+            new_value: Any # The new collection
+            ) -> None:
+        ''' Replaces the whole collection.'''
+        if not self.equals(self.value, new_value):
+            self.assign(self.pairs(new_value))
+            self.changed()
+        elif hooks.active: hooks.emit('set', self, changed=False)
+
+    def merge(self, deltas: list) -> list: return [op for ops in deltas for op in ops] # in the order they were applied
+
+    def map_items(self,
+                  fn: Callable[[Any], Any] # applied to each item
+                  ) -> KeyedStore: # derived collection of the same kind, with the same keys
+        ''' Creates a derived collection holding `fn(item)` for each item, recomputed only for the items inserted or updated.'''
+        return self.Mapped(self, fn)
+
+# %% ../nbs/08_keyed.ipynb 7
+class ListStore(KeyedStore):
+    ''' A Writable Store holding a list of items with unique keys.'''
+    __slots__ = ('key', 'keys', 'positions')
+    def __init__(self,
+                 initial_value: Iterable = (), # initial items
+                 key: Callable[[Any], Hashable] = utils.identity, # the key of an item
+                 start: Notifier = utils.noop, # A Notifier (Optional), its `set_fn` is the store `set`
+                 equals: Equality = utils.structural_equal # Equality policy of the lists passed to `set`, and of the items
+                 ) -> None:
+        self.key = key
+        super().__init__(initial_value, start, equals)
+
+    def pairs(self, collection: Iterable) -> Iterable[tuple]: return ((self.key(item), item) for item in collection)
+    def items(self) -> Iterator[tuple]: return zip(self.keys, self.value)
+
+    def assign(self, pairs: Iterable[tuple]) -> None:
+        pairs = list(pairs)
+        positions = {key: i for i, (key, _) in enumerate(pairs)}
+        if len(positions) != len(pairs): raise KeyError("Duplicate keys in a ListStore.")
+        self.positions = positions # the index of each key
+        self.keys = [key for key, _ in pairs] # the key of each item, in order
+        self.value = [item for _, item in pairs]
+
+    def __reindex(self, start: int, stop: int) -> None:
+        for i in range(start, stop): self.positions[self.keys[i]] = i
+
+    def check(self, key: Hashable, item: Any) -> None:
+        ''' Raises a `KeyError` unless `key` is the key of `item`.'''
+        if self.key(item) != key: raise KeyError(f"{key!r} is not the key of {item!r}")
+
+    def apply(self, op: Op) -> Optional[Op]:
+        kind, key, item, index = op
+        size = len(self.keys)
+        if kind in ('update', 'insert'): self.check(key, item)
+        if kind == 'update':
+            index = self.positions[key]
+            if self.equals(self.value[index], item): return None
+            self.value[index] = item
+        elif kind == 'insert':
+            if key in self.positions: raise KeyError(key)
+            index = size if index is None else index
+            if not 0 <= index <= size: raise IndexError(index)
+            self.keys.insert(index, key)
+            self.value.insert(index, item)
+            self.__reindex(index, size + 1)
+        elif kind == 'remove':
+            index = self.positions.pop(key)
+            del self.keys[index]
+            item = self.value.pop(index)
+            self.__reindex(index, size - 1)
+        elif kind == 'move':
+            old = self.positions[key]
+            if not 0 <= index < size: raise IndexError(index)
+            if index == old: return None
+            del self.keys[old]
+            item = self.value.pop(old)
+            self.keys.insert(index, key)
+            self.value.insert(index, item)
+            self.__reindex(min(old, index), max(old, index) + 1)
+        else: raise ValueError(f"Unknown operation: {kind}")
+        return Op(kind, key, item, index)
+
+    def __getitem__(self, key: Hashable) -> Any: return self.value[self.positions[key]]
+    def __contains__(self, key: Hashable) -> bool: return key in self.positions
+
+    def insert(self, index: int, item: Any) -> None:
+        ''' Inserts `item` at `index`.'''
+        self.patch([Op('insert', self.key(item), item, index)])
+
+    def append(self, item: Any) -> None:
+        ''' Inserts `item` at the end.'''
+        self.patch([Op('insert', self.key(item), item)])
+
+    def remove(self, key: Hashable) -> None:
+        ''' Removes the item at `key`.'''
+        self.patch([Op('remove', key)])
+
+    def move(self, key: Hashable, index: int) -> None:
+        ''' Moves the item at `key` to `index`.'''
+        self.patch([Op('move', key, index=index)])
+
+    def __repr__(self) -> str: return f"l{super().__repr__()[1:]}"
+
+class MapStore(KeyedStore):
+    ''' A Writable Store holding a dict. Its items have no position: it does not support `move`.'''
+    __slots__ = ()
+    def __init__(self,
+                 initial_value: Any = (), # initial dict, or anything `dict` accepts
+                 start: Notifier = utils.noop, # A Notifier (Optional), its `set_fn` is the store `set`
+                 equals: Equality = utils.structural_equal # Equality policy of the dicts passed to `set`, and of the items
+                 ) -> None:
+        super().__init__(initial_value, start, equals)
+
+    def pairs(self, collection: Any) -> Iterable[tuple]: return dict(collection).items()
+    def items(self) -> Iterator[tuple]: return iter(self.value.items())
+    def assign(self, pairs: Iterable[tuple]) -> None: self.value = dict(pairs)
+
+    def apply(self, op: Op) -> Optional[Op]:
+        kind, key, item, _ = op
+        if kind == 'update':
+            if self.equals(self.value[key], item): return None
+            self.value[key] = item
+        elif kind == 'insert':
+            if key in self.value: raise KeyError(key)
+            self.value[key] = item
+        elif kind == 'remove': item = self.value.pop(key)
+        else: raise ValueError(f"Unknown operation on a MapStore: {kind}")
+        return Op(kind, key, item)
+
+    def __getitem__(self, key: Hashable) -> Any: return self.value[key]
+    def __contains__(self, key: Hashable) -> bool: return key in self.value
+
+    def __repr__(self) -> str: return f"m{super().__repr__()[1:]}"
+
+# %% ../nbs/08_keyed.ipynb 13
+class MappedItems:
+    ''' Mixin of the derived collections created by `map_items`.'''
+    __slots__ = ()
+    def __init__(self,
+                 source: KeyedStore, # the source collection
+                 fn: Callable[[Any], Any] # applied to each item
+                 ) -> None:
+        self.sources, self.fn = (source,), fn
+        self.dirty = False # True while queued for recomputation
+        self.stale: list = [] # operations applied to the source since the last recomputation, or `...`
+        def start(set_fn):
+            self.dirty = True # the change subscriber is called right away with `...`: recomputed below, not queued
+            unsubscribe = source.subscribe_changes(self.invalidate, CRITICAL) # like a derived store
+            self.dirty = False
+            self.recompute() # sync with the source, it can have changed since creation
+            def stop():
+                self.stale.clear()
+                unsubscribe()
+            return stop
+        super().__init__((), start=start)
+        self.assign((key, fn(item)) for key, item in source.items())
+        self.rank = 1 + source.rank # ranked above its source, see `stores.DerivedStore`
+
+    def pairs(self, collection: Any) -> Iterable[tuple]: return collection # already paired by `recompute`
+    def check(self, key: Hashable, item: Any) -> None: pass # the items are mapped from the source items, under their keys
+
+    def invalidate(self,
+                   collection: Any, # the source collection (ignored)
+                   ops: Any # the operations applied to the source, or `...`
+                   ) -> None:
+        ''' Change subscriber of the source: queues the recomputation of the items changed by `ops`.'''
+        self.stale.append(ops)
+        propagation.schedule(self)
+
+    def recompute(self) -> None:
+        ''' Applies `fn` to the items inserted or updated in the source only.'''
+        if not self.stale: return # stopped while queued
+        ops = ... if any(ops is ... for ops in self.stale) else self.merge(self.stale)
+        self.stale.clear()
+        started = hooks.active and now()
+        if ops is ...: pairs = [(key, self.fn(item)) for key, item in self.sources[0].items()]
+        else: ops = [op._replace(value=self.fn(op.value)) if op.kind in ('insert', 'update') else op for op in ops]
+        if started: hooks.emit('recompute', self, now() - started, delta=ops)
+        if ops is not ...: return KeyedStore.patch(self, ops)
+        old = self.value
+        self.assign(pairs)
+        if not self.equals(old, self.value): self.changed()
+
+    def set(self, *args, **kwargs): raise Exception("Cannot set a Mapped Store.")
+    def patch(self, *args, **kwargs): raise Exception("Cannot patch a Mapped Store.")
+
+class MappedList(MappedItems, ListStore):
+    ''' A derived `ListStore`, see `KeyedStore.map_items`.'''
+    __slots__ = ('sources', 'fn', 'dirty', 'stale')
+
+class MappedMap(MappedItems, MapStore):
+    ''' A derived `MapStore`, see `KeyedStore.map_items`.'''
+    __slots__ = ('sources', 'fn', 'dirty', 'stale')
+
+ListStore.Mapped, MapStore.Mapped = MappedList, MappedMap
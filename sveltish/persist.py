@@ -0,0 +1,143 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/07_persist.ipynb.
+
+# %% ../nbs/07_persist.ipynb 4
+from __future__ import annotations
+import os, pickle, struct, sys
+from typing import Any, Callable, Dict, Mapping, Union
+from .stores import Store, Unsubscriber, batch
+
+# %% auto 0
+__all__ = ['MAGIC', 'ALIGN', 'PathLike', 'snapshot', 'load', 'restore', 'ChangeLog', 'replay']
+
+# %% ../nbs/07_persist.ipynb 5
+MAGIC = b'SVLTSNP1' # first bytes of a snapshot
+ALIGN = 64 # alignment of the arrays in a snapshot
+PathLike = Union[str, os.PathLike]
+
+def _raw(value: Any) -> bool:
+    ''' True for the arrays stored as raw bytes. NumPy is only imported if the value is an array.'''
+    np = sys.modules.get('numpy')
+    return np is not None and isinstance(value, np.ndarray) and not value.dtype.hasobject
+
+def snapshot(stores: Mapping[str, Store], # the stores, by name
+             path: PathLike # the snapshot file, replaced atomically
+             ) -> None:
+    ''' Writes the values of `stores` to `path`.'''
+    index: Dict[str, tuple] = {} # name -> ('pickle', offset, size) or ('array', offset, dtype, shape)
+    tmp = f'{os.fspath(path)}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(MAGIC)
+        for name, store in stores.items():
+            value = store.get()
+            if _raw(value):
+                import numpy as np
+                f.write(b'\0' * (-f.tell() % ALIGN))
+                array = np.ascontiguousarray(value)
+                index[name] = ('array', f.tell(), array.dtype, array.shape) # the dtype, not its `str`, which loses the fields of a structured dtype
+                f.write(array.data)
+            else:
+                data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+                index[name] = ('pickle', f.tell(), len(data))
+                f.write(data)
+        offset = f.tell()
+        f.write(pickle.dumps(index, pickle.HIGHEST_PROTOCOL))
+        f.write(struct.pack('<Q', offset)) # the index is found from the end of the file
+    os.replace(tmp, path)
+
+def load(path: PathLike, # a file written by `snapshot`
+         mmap: bool = True # map the arrays instead of reading them
+         ) -> Dict[str, Any]: # the values, by name
+    ''' Reads the values of a snapshot.'''
+    values: Dict[str, Any] = {}
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC: raise ValueError(f"{path} is not a snapshot")
+        end = f.seek(-8, os.SEEK_END)
+        offset, = struct.unpack('<Q', f.read(8))
+        f.seek(offset)
+        index = pickle.loads(f.read(end - offset))
+        for name, (kind, offset, *info) in index.items():
+            if kind == 'pickle':
+                f.seek(offset)
+                values[name] = pickle.loads(f.read(info[0]))
+                continue
+            import numpy as np
+            dtype, shape = np.dtype(info[0]), info[1]
+            if mmap and dtype.itemsize * int(np.prod(shape)): values[name] = np.memmap(path, dtype, 'c', offset, shape)
+            else:
+                f.seek(offset)
+                values[name] = np.frombuffer(bytearray(f.read(dtype.itemsize * int(np.prod(shape)))), dtype).reshape(shape)
+    return values
+
+def restore(stores: Mapping[str, Store], # the stores, by name
+            path: PathLike, # a file written by `snapshot`
+            mmap: bool = True # map the arrays instead of reading them
+            ) -> None:
+    ''' Sets the stores to the values in the snapshot, in a single batch. Stores missing from the snapshot are left as they are.'''
+    values = load(path, mmap)
+    with batch():
+        for name, value in values.items():
+            if name in stores: stores[name].set(value)
+
+# %% ../nbs/07_persist.ipynb 9
+def _complete(path: PathLike) -> int:
+    ''' Size of the complete records at the start of a change log: a crash can leave the last one torn.'''
+    with open(path, 'rb') as f:
+        total, end = os.fstat(f.fileno()).st_size, 0
+        while len(header := f.read(4)) == 4:
+            size, = struct.unpack('<I', header)
+            if end + 4 + size > total: break
+            end = f.seek(size, os.SEEK_CUR)
+    return end
+
+class ChangeLog:
+    ''' An append-only log of the values set in named stores.'''
+    def __init__(self, path: PathLike) -> None:
+        self.path = path
+        self.file = open(path, 'ab')
+        self.file.truncate(_complete(path)) # the records are appended after the last complete one, not after a torn one
+
+    def append(self, name: str, value: Any) -> None:
+        ''' Appends a record: its size, then the pickled name and value.'''
+        data = pickle.dumps((name, value), pickle.HIGHEST_PROTOCOL)
+        self.file.write(struct.pack('<I', len(data)) + data)
+
+    def attach(self, stores: Mapping[str, Store]) -> Unsubscriber:
+        ''' Appends the values set in `stores` from now on, until the returned function is called.'''
+        def follower(name: str) -> Callable[[Any], None]:
+            initial = True
+            def follow(value: Any) -> None:
+                nonlocal initial
+                if initial: initial = False # the value at subscription time is not a change
+                else: self.append(name, value)
+            return follow
+        unsubscribers = [store.subscribe(follower(name)) for name, store in stores.items()]
+        def detach() -> None:
+            for unsubscribe in unsubscribers: unsubscribe()
+        return detach
+
+    def flush(self) -> None:
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self) -> None: self.file.close()
+    def __enter__(self) -> ChangeLog: return self
+    def __exit__(self, *args) -> None: self.close()
+
+def replay(stores: Mapping[str, Store], # the stores, by name
+           path: PathLike # a file written by a `ChangeLog`
+           ) -> int: # number of records read
+    ''' Sets each store to its last value in the log, in a single batch. A truncated last record, left by a crash, is ignored.'''
+    last: Dict[str, Any] = {}
+    count = 0
+    with open(path, 'rb') as f:
+        while len(header := f.read(4)) == 4:
+            size, = struct.unpack('<I', header)
+            data = f.read(size)
+            if len(data) < size: break
+            name, value = pickle.loads(data)
+            last[name] = value
+            count += 1
+    with batch():
+        for name, value in last.items():
+            if name in stores: stores[name].set(value)
+    return count
@@ -0,0 +1,116 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/01_propagation.ipynb.
+
+# %% auto 0
+__all__ = ['CRITICAL', 'NORMAL', 'LOW', 'Scheduler', 'propagation', 'Propagation', 'batch', 'next_tick', 'set_scheduler']
+
+# %% ../nbs/01_propagation.ipynb 4
+import heapq
+from collections import deque
+from contextlib import contextmanager
+from itertools import count
+from threading import local
+from typing import Any, Callable, Hashable, Iterator, Optional
+
+# %% ../nbs/01_propagation.ipynb 5
+CRITICAL, NORMAL, LOW = -1, 0, 1 # lanes: the notifications of a lower lane run first, see `Propagation.commit`
+Scheduler = Callable[[Callable[[], None]], Any] # calls its argument later, on the same thread
+
+class Propagation(local):
+    ''' A queue of dirty nodes, flushed in topological (rank) order. Each thread has its own queue.'''
+    def __init__(self) -> None:
+        self.queue: list = [] # heap of (rank, order, node)
+        self.order = count() # tie breaker, keeps nodes of the same rank in FIFO order
+        self.flushing = False # True while the queue is being flushed
+        self.depth = 0 # number of open batches
+        self.pending: dict = {} # notifications deferred until the outermost batch closes, by key
+        self.lanes = (deque(), deque(), deque()) # keys of the pending notifications, by lane
+        self.scheduler: Optional[Scheduler] = None # None: writes notify synchronously, see `set_scheduler`
+
+    def schedule(self, node) -> None:
+        ''' Marks `node` as dirty and queues it to be recomputed in the next flush.'''
+        if node.dirty: return # already queued
+        node.dirty = True
+        heapq.heappush(self.queue, (node.rank, next(self.order), node))
+
+    def flush(self) -> None:
+        ''' Recomputes the queued nodes, unless a flush is running or a batch is open.'''
+        if self.flushing or self.depth: return # handled by the running flush or when the batch closes
+        self.drain()
+
+    def drain(self) -> None:
+        ''' Recomputes the queued nodes, lowest rank first, until the queue is empty.'''
+        flushing, self.flushing = self.flushing, True
+        error = None
+        while self.queue:
+            _, _, node = heapq.heappop(self.queue)
+            node.dirty = False
+            try: node.recompute()
+            except BaseException as e: # the other nodes are still recomputed: none is left dirty for the next flush
+                if error is None: error = e
+        self.flushing = flushing
+        if error is not None: raise error
+
+    def defer(self,
+              key: Hashable, # identifies the notification, e.g. the store or the subscriber
+              fn: Callable[[], None], # the deferred notification
+              lane: int = NORMAL # `CRITICAL`, `NORMAL` or `LOW`
+              ) -> None:
+        ''' Defers a notification until the outermost batch closes. Only the first `fn` deferred under `key` is kept.'''
+        if key not in self.pending:
+            self.pending[key] = fn
+            self.lanes[lane + 1].append(key)
+
+    def commit(self) -> None:
+        ''' Runs the deferred notifications, lane by lane in the order they were first deferred. The queue is drained whenever the `CRITICAL` lane is empty.'''
+        self.depth += 1 # writes made by the notifications and the recomputed nodes are deferred as well
+        error = None
+        try:
+            while self.pending or self.queue:
+                try:
+                    if self.queue and not self.lanes[0]: self.drain() # the nodes are invalidated in the CRITICAL lane, see `stores.DerivedStore`
+                    else:
+                        keys = next(keys for keys in self.lanes if keys) # a notification can defer one in a lower lane
+                        self.pending.pop(keys.popleft())()
+                except BaseException as e: # the other notifications still run: none is left pending for the next batch
+                    if error is None: error = e
+        finally: self.depth -= 1
+        if error is not None: raise error
+
+    def open_tick(self) -> bool:
+        ''' Opens a batch closed by the `scheduler`. Called by the first write made outside a batch.'''
+        if self.flushing: return False # a derived store written by the flush of a tick: part of that tick, not the next one
+        self.depth += 1
+        try: self.scheduler(self.close_tick)
+        except BaseException:
+            self.depth -= 1
+            raise
+        return True
+
+    def close_tick(self) -> None:
+        ''' Closes the batch opened by `open_tick`, notifying unless another batch is still open.'''
+        self.depth -= 1
+        if not self.depth: self.commit()
+
+propagation = Propagation() # the propagation queue used by the stores
+
+# %% ../nbs/01_propagation.ipynb 9
+@contextmanager
+def batch() -> Iterator[None]:
+    ''' Context manager that defers notifications until the outermost batch closes, even when an exception escapes it.'''
+    propagation.depth += 1
+    try: yield
+    finally:
+        propagation.depth -= 1
+        if not propagation.depth: propagation.commit()
+
+# %% ../nbs/01_propagation.ipynb 14
+def next_tick(fn: Callable[[], None]) -> None:
+    ''' Calls `fn` on the next iteration of the running event loop.'''
+    import asyncio # only needed by the deferred scheduler
+    asyncio.get_running_loop().call_soon(fn)
+
+def set_scheduler(scheduler: Optional[Scheduler] # `next_tick`, or None to notify synchronously
+                  ) -> Optional[Scheduler]: # the previous scheduler
+    ''' Sets how the writes made by this thread outside a batch are notified.'''
+    previous, propagation.scheduler = propagation.scheduler, scheduler
+    return previous
@@ -3,126 +3,220 @@
 # %% ../nbs/03_signals.ipynb 1
 from __future__ import annotations
 from typing import Callable, Optional, Set, Any, NamedTuple, Protocol, Tuple, Dict, TypeVar
-from fastcore.test import test_eq, test_fail
-from .utils import Bunch
+from functools import partial
+from operator import attrgetter
+from .propagation import propagation, batch, CRITICAL, NORMAL
+from .instrument import hooks, now
+from .utils import Latest, apply, compose
+import sys, weakref
+from contextvars import ContextVar
+from threading import Lock, RLock
+from typing import TYPE_CHECKING
+if TYPE_CHECKING: from concurrent.futures import Executor
 
 # %% auto 0
 __all__ = ['T', 'Getter', 'Setter', 'Subscriber', 'Unsubscriber', 'context', 'observable', 'cell', 'observer', 'callback',
-           'effect', 'view', 'derived', 'formula', 'Observable', 'Observer', 'Readable', 'Writable', 'Signal',
-           'Callback', 'signal', 'reaction', 'writable', 'pipe', 'computed', 'readonly']
+           'effect', 'view', 'derived', 'formula', 'Observable', 'Observer', 'Readable', 'Writable', 'Callback',
+           'Signal', 'signal', 'track', 'untrack', 'WeakCallback', 'Reaction', 'reaction', 'writable', 'pipe',
+           'Readers', 'Computed', 'computed', 'set_many', 'readonly']
 
-# %% ../nbs/03_signals.ipynb 3
+# %% ../nbs/03_signals.ipynb 4
 T = Optional[TypeVar("T")]
 Getter = Callable[[],T]
 Setter = Callable[[T], None]
 Subscriber = Callable[[T], None] # a callback
 Unsubscriber = Callable[[], None] # a callback to be used upon termination of the subscription
 class Observable(Protocol):
+    __slots__ = ()
     def subscribe(self, 
                   observer: Callable[[Any], None]
                   ) -> None: ...
 class Observer(Protocol):
+    __slots__ = ()
     def run(self) -> None: ...
     def cancel(self) -> None: ...
-class Readable(Bunch):
+class Readable:
     ''' An observable that can be read.'''
-    def __init__(self, 
-                 read: Getter
-                 ): self.read = read
+    __slots__ = ()
+    def read(self) -> T: ...
     def __repr__(self): 
         return f'${(self.read()).__class__.__name__}: {self.read().__repr__()}'
     def asTuple(self):
-        return self.__dict__.values()
+        return (self.read,)
     
 class Writable(Readable):
     ''' An observable that can be read and set.'''
-    def __init__(self, read, 
-                 write:Setter): 
-        super().__init__(read)
-        self.write = write
+    __slots__ = ()
+    def write(self, value: T) -> None: ...
+    def asTuple(self):
+        return (self.read, self.write)
+
+class Callback(Observer):
+    ''' A callback is a function that is called when a signal changes.'''
+    __slots__ = ('subscriptions', 'version', 'touched', 'lane', '__weakref__')
+    def __init__(self,
+                 lane: int = NORMAL # `CRITICAL` callbacks run first, `LOW` ones last, see `propagation`
+                 ) -> None:
+        self.subscriptions: Dict[Any, int] = {} # the version of the last run that read each signal the callback is subscribed to
+        self.version = 0 # incremented on each run, stamps the subscriptions read during the run
+        self.touched = 0 # number of subscriptions read during the current run
+        self.lane = lane
+    def run(self) -> None: ...
+    def cancel(self) -> None: untrack(self)
+
+# %% ../nbs/03_signals.ipynb 6
+context: ContextVar = ContextVar('context', default=None) # the reaction tracking its dependencies in this thread or task
+
 
 class Signal(Writable, Observable):
     ''' A signal (aka store) stores a value and run callbacks when the value changes.
     '''
+    __slots__ = ('value', 'subscribers', 'lock', '__weakref__')
     def __init__(self, 
-                 read: Getter, 
-                 write:Setter,
-                 subscribe: Callable): 
-        super().__init__(read, write)
-        self.subscribe = subscribe
-    subscribe = lambda self, observer: self.subscribe(observer)
+                 value: T = None # initial value
+                 ) -> None:
+        self.value = value
+        self.subscribers: dict = {} # copy-on-write, replaced under `lock`, ordered by lane
+        self.lock = Lock()
 
+    def subscribe(self,
+                  callback: Callback # callback to be run when the signal value changes
+                  ) -> None:
+        '''Add callback to list of subscribers to be executed when the signal value changes.
+        Also adds the signal to the callback's subscriptions.
+        '''
+        with self.lock:
+            subscribers = self.subscribers
+            if subscribers and callback not in subscribers and next(reversed(subscribers)).lane > callback.lane:
+                self.subscribers = dict.fromkeys(sorted([*subscribers, callback], key=attrgetter('lane'))) # sorting is stable
+            else: self.subscribers = {**subscribers, callback: None}
+        callback.subscriptions[self] = callback.version
+        if hooks.active: hooks.emit('subscribe', self, fanout=len(self.subscribers))
 
-# Signal = Tuple[Getter, Setter, Callable[[Subscriber], None]]
-class Callback(Bunch, Observer):
-    ''' A callback is a function that is called when a signal changes.'''
-    def __init__(self, 
-                 run:Callable[[], None], # the function to be called
-                 cancel:Callable[[], None], # cancels the subscription
-                 subscriptions:Set[Any] # observables the callback is subscribed to
-                 ): 
-        self.run = run
-        self.cancel = cancel
-        self.subscriptions = subscriptions
-    run = lambda self: self.run()
-    cancel = lambda self: self.cancel()
+    def unsubscribe(self, callback: Callback) -> None:
+        with self.lock:
+            subscribers = dict(self.subscribers)
+            subscribers.pop(callback, None)
+            self.subscribers = subscribers
+        if hooks.active: hooks.emit('unsubscribe', self, fanout=len(self.subscribers))
 
-# %% ../nbs/03_signals.ipynb 4
-context = [] # a stack of dependencies of the current reaction
+    def read(self) -> T: # signal getter
+        callback = context.get()
+        if callback is not None:
+            version = callback.subscriptions.get(self)
+            if version is None: self.subscribe(callback)
+            elif version == callback.version: return self.value # already read during this run
+            else: callback.subscriptions[self] = callback.version # still a dependency: stamp it, no need to subscribe again
+            callback.touched += 1
+        return self.value
+
+    def write(self, newValue: T) -> None: # signal setter
+        self.value = newValue
+        callbacks = self.subscribers # a snapshot: run can replace the subscribers
+        if propagation.depth or propagation.scheduler and propagation.open_tick(): # inside a batch: each subscriber runs once, when the batch closes
+            if hooks.active: hooks.emit('set', self, changed=None)
+            for callback in callbacks:
+                if callback not in propagation.pending: propagation.defer(callback, partial(self.notify, callback), callback.lane)
+            return
+        if callbacks and next(iter(callbacks)).lane == CRITICAL: # e.g. a computed: marked dirty before the reactions reading it run
+            with batch(): return self.write(newValue)
+        if hooks.active:
+            hooks.emit('set', self, changed=True)
+            started = now()
+            for callback in callbacks: callback.run()
+            return hooks.emit('notify', self, now() - started, fanout=len(callbacks))
+        for callback in callbacks: callback.run()
+
+    def notify(self, callback: Callback) -> None:
+        ''' Runs `callback` at the end of a batch, unless it unsubscribed in the meantime.'''
+        if callback in self.subscribers: callback.run()
 
 
 def signal(
     value: T = None # initial value
     ) -> Signal:
     ''' Signal factory.'''
-    subscribers = set()
+    return Signal(value)
 
-    def subscribe(
-        callback: Subscriber # callback to be called when the store value changes
-        ) -> None:
-        '''Add callback to list of subscribers to be executed when the signal value changes.
-        Also adds unsubscribe function to the callback's subscriptions.
-        '''
-        subscribers.add(callback.run)
-        callback.subscriptions.add(lambda: subscribers.discard(callback.run))
 
-    def read() -> T: # signal getter
-        callback = context[-1] if context else None
-        if callback: subscribe(callback)
-        return value
+def track(callback: Callback, # the callback whose dependencies are tracked
+          fn: Callable # the function whose reads are tracked
+          ) -> Any:
+    ''' Runs `fn` tracking the signals it reads, then unsubscribes `callback` from the signals it no longer reads.'''
+    callback.version += 1
+    callback.touched = 0
+    token = context.set(callback)
+    try: return fn()
+    finally:
+        context.reset(token)
+        subscriptions = callback.subscriptions
+        if callback.touched != len(subscriptions): # some dependencies were not read: drop them
+            for s in [s for s, version in subscriptions.items() if version != callback.version]:
+                del subscriptions[s]
+                s.unsubscribe(callback)
+
+def untrack(callback: Callback) -> None:
+    ''' Unsubscribes `callback` from all its dependencies.'''
+    for s in callback.subscriptions: s.unsubscribe(callback)
+    callback.subscriptions.clear()
+
+class WeakCallback(Callback):
+    ''' Subscribed in place of `callback`, without keeping it alive. Untracks itself when `callback` is garbage collected.'''
+    __slots__ = ('ref',)
+    def __init__(self, callback: Callback) -> None:
+        super().__init__(callback.lane)
+        self.ref = weakref.ref(callback, lambda _, is_finalizing=sys.is_finalizing: is_finalizing() or untrack(self)) # see `instrument.node_of`
 
-    def write(newValue: T) -> None: # signal setter
-        nonlocal value
-        value = newValue
-        # run can change the subscribers set, so we need to copy it
-        for run in subscribers.copy():run()
+    def run(self) -> None:
+        callback = self.ref()
+        if callback is not None: callback.run()
 
-    return Signal(read, write, subscribe)
+class Reaction(Callback):
+    ''' A callback running `fn` each time a signal it read changes.'''
+    __slots__ = ('fn', 'lock', 'running', 'triggered', 'tracker')
+    def __init__(self,
+                 fn: Callable,
+                 weak: bool = False, # the signals do not keep the reaction alive, see `reaction`
+                 lane: int = NORMAL # see `Callback`
+                 ) -> None:
+        super().__init__(lane)
+        self.fn = fn
+        self.lock = Lock() # guards `running` and `triggered`
+        self.running = self.triggered = False
+        self.tracker = WeakCallback(self) if weak else self # the callback subscribed to the signals
 
+    def run(self) -> None:
+        with self.lock:
+            if self.running: # running on another thread, or triggered by its own writes: run again when done
+                self.triggered = True
+                return
+            self.running = True
+        try:
+            while True:
+                started = hooks.active and now()
+                track(self.tracker, self.fn) # only the dependencies that changed since the last run are (un)subscribed
+                if started: hooks.emit('recompute', self, now() - started)
+                with self.lock:
+                    if not self.triggered: break
+                    self.triggered = False
+        finally:
+            with self.lock: self.running = self.triggered = False
 
-def reaction(fn: Callable) -> Callback:
+    def cancel(self) -> None: untrack(self.tracker)
+
+def reaction(fn: Callable,
+             weak: bool = False, # cancel the reaction when it is garbage collected, instead of keeping it alive
+             lane: int = NORMAL # `CRITICAL` reactions run before the others, `LOW` ones after them
+             ) -> Callback:
     ''' Reaction factory. A reaction is a callback that is called when a signal changes.\n
     Also known as: effect, observer, callback, computed, formula, derived.'''
-    def cancel():
-        nonlocal callback
-        # unsubscribe function can change the set, so we need to copy it
-        for u in callback.subscriptions.copy(): u()
-        callback = Callback(callback.run, callback.cancel, set())
-
-    def run():
-        cancel()
-        context.append(callback)
-        try: fn()
-        finally: context.pop()
-
-    callback = Callback(run, cancel, set())
-    run()
+    callback = Reaction(fn, weak, lane)
+    callback.run()
     return callback
 
 def writable(value:T=None) -> Writable:
     ''' Writable factory. A writable is an interface to a signal.'''
-    s = signal(value)
-    return Writable(s.read, s.write)
+    return Signal(value)
 
 from .utils import compose
 from functools import reduce
@@ -135,13 +229,76 @@ def pipe(*fns):
     # _ = reaction(lambda: w.write(fn()))
     return w.read
 
-def computed(fn) -> Getter:
-    ''' A computed is a signal that is derived from other signals. It is a kind of cache of a reaction.'''
-    w = writable()
-    _ = reaction(lambda: w.write(fn()))
-    return w.read
+class Readers(Signal):
+    ''' The signal notifying the readers of a computed. Its value is unused.'''
+    __slots__ = ('computed',)
+    def __init__(self, computed: Computed) -> None:
+        super().__init__()
+        self.computed = weakref.ref(computed) # see `instrument.node_of`
+
+class Computed(Callback):
+    ''' A lazy cache of `fn`, see `computed`. Reading it is calling it.'''
+    __slots__ = ('fn', 'value', 'dirty', 'lock', 'readers', 'functions', 'executor', 'tracker')
+    def __init__(self,
+                 fn: Callable, # reads the signals
+                 functions: tuple = (), # applied to the result of `fn`, in `executor` if any
+                 executor: Optional[Executor] = None # runs `functions` off the reader's thread
+                 ) -> None:
+        super().__init__(CRITICAL) # dirty before the reactions reading it run
+        self.fn = fn if executor else compose(fn, *functions)
+        self.functions = functions
+        self.executor = Latest(executor) if executor else None
+        self.value = None
+        self.dirty = True # the cached value is stale
+        self.lock = RLock() # guards the recomputation
+        self.readers = Readers(self) # only tracks and notifies the readers of the computed
+        self.tracker = WeakCallback(self) # the dependencies do not keep an unread computed alive
+
+    def run(self) -> None:
+        ''' Run when a dependency changes: marks the computed dirty and notifies the readers.'''
+        with self.lock: # waits for a recomputation running on another thread, which is tracking the dependencies
+            if self.dirty: return
+            self.dirty = True # the dependencies are kept: the next read only (un)subscribes the ones that changed
+        self.readers.write(None)
+
+    def cancel(self) -> None: untrack(self.tracker)
+
+    def read(self) -> T:
+        self.readers.read() # subscribes the reaction (or computed) reading this computed
+        with self.lock:
+            if self.dirty:
+                self.dirty = False # a change during fn marks it dirty again
+                started = hooks.active and now()
+                try: value = track(self.tracker, self.fn)
+                except BaseException:
+                    self.dirty = True
+                    raise
+                if started: hooks.emit('recompute', self, now() - started)
+                if self.executor: self.executor.submit(self.land, apply, self.functions, *(value if type(value) is tuple else (value,)))
+                else: self.value = value
+        return self.value
+    __call__ = read
+
+    def land(self, value: T) -> None:
+        ''' Caches a value computed by the executor and notifies the readers.'''
+        self.value = value
+        self.readers.write(None)
+
+def computed(fn: Callable, # reads the signals, and computes the value unless `functions` are given
+             *functions: Callable, # applied to the result of `fn`, like the functions of a derived store
+             executor: Optional[Executor] = None # a thread or process pool running `functions`
+             ) -> Getter:
+    ''' A computed is a signal that is derived from other signals. It is a lazy cache of `fn`:\n
+    a change in its dependencies only marks it dirty, and `fn` runs again when the computed is read.'''
+    return Computed(fn, functions, executor)
+
 
 
+def set_many(values: dict # maps each Writable to its new value
+             ) -> None:
+    ''' Writes several signals at once, running each subscriber at most once after all values are written.'''
+    with batch():
+        for w, value in values.items(): w.write(value)
 
 def readonly(value:T=None) -> Getter:
     w = writable(value)
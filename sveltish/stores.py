@@ -3,60 +3,82 @@
 # %% ../nbs/00_stores.ipynb 0
 from __future__ import annotations
 from typing import Callable, TypeVar,  Generic, Union, Optional, Set, Protocol, Any, Sequence
-from fastcore.test import test_eq, test_fail
 
 # %% auto 0
-__all__ = ['T', 'covT', 'Subscriber', 'Unsubscriber', 'Updater', 'Notifier', 'Readable', 'StoreProtocol', 'Writable', 'Store',
-           'writable', 'ReadableStore', 'readable', 'DerivedStore', 'derived', 'pipe']
+__all__ = ['T', 'covT', 'Subscriber', 'Unsubscriber', 'Updater', 'Notifier', 'Equality', 'Readable', 'ChangeSubscriber',
+           'StoreProtocol', 'Writable', 'Store', 'writable', 'ReadableStore', 'readable', 'DerivedStore', 'derived',
+           'set_many', 'pipe', 'PathStore', 'select', 'at', 'ChangeStore']
 
-# %% ../nbs/00_stores.ipynb 6
+# %% ../nbs/00_stores.ipynb 7
 T = TypeVar("T")
 covT = TypeVar("covT", covariant=True)
 Subscriber = Callable[[T], None] # a callback
 Unsubscriber = Callable[[], None] # a callback to be used upon termination of the subscription
 Updater = Callable[[T], T]
 Notifier = Callable[[Subscriber], Union[Unsubscriber, None]]
+Equality = Callable[[T, T], bool] # returns True when the old and the new value are equal (no notification)
 
 class StoreProtocol(Protocol, Generic[covT]):
     ''' The Svelte Store ~~contract~~ protocol. '''
+    __slots__ = ()
     def subscribe(self, subscriber: Subscriber[T]) -> Unsubscriber: ...
 
 Readable: TypeAlias = StoreProtocol[T]
 
 class Writable(Readable[T]):
     ''' Writable protocol'''
+    __slots__ = ()
     def set(self, value: T) -> None: ...
     def update(self, updater: Updater[T]) -> None: ...
 
-# %% ../nbs/00_stores.ipynb 9
+# %% ../nbs/00_stores.ipynb 10
 import sveltish.utils as utils
+from .propagation import propagation, batch, CRITICAL, NORMAL
+from .instrument import hooks, now
+from functools import partial
+from typing import TYPE_CHECKING
+if TYPE_CHECKING: from concurrent.futures import Executor # only used in annotations, importing it is slow
 
-# %% ../nbs/00_stores.ipynb 10
+# %% ../nbs/00_stores.ipynb 11
 class Store(Readable[T]):
     ''' A Writable Store.'''
+    __slots__ = ('value', 'equals', 'subscribers', 'start', 'stop', 'rank', 'node', '__weakref__')
+    proxy: bool = True # forward unknown attributes to the value, see `__getattr__`
     def __init__(self:Writable,
                 initial_value: Any = None, # initial value of the store
-                start: Notifier = utils.noop # A Notifier (Optional)
+                start: Notifier = utils.noop, # A Notifier (Optional)
+                equals: Equality = utils.safe_equal # Equality policy deciding whether a new value is a change
                 ) -> None:
         self.value = initial_value
-        self.subscribers: Set[Subscriber] = set() # callbacks to be called when the value changes
+        self.equals: Equality = equals
+        if hasattr(equals, 'prime'): equals.prime(initial_value) # a stateful policy, see `utils.KeyEqual`
+        self.subscribers: utils.Subscribers = utils.Subscribers() # callbacks to be called when the value changes, in subscription order
         self.start: Notifier = start # function called when the first subscriber is added
         self.stop: Optional[Unsubscriber] = None  # functional called when the last subscriber is removed
+        self.rank: int = 0 # position in the topological order of the store graph
+        self.node: Optional[Any] = None # the DerivedStore computing the value of this store, if any
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._fields = frozenset(k for c in cls.__mro__ for k in c.__dict__.get('__slots__', ()))
 
     def get(self) -> T: return self.value
     __call__ = get
 
     def subscribe(self:Writable,
-                  callback: Subscriber # callback to be called when the store value changes
+                  callback: Subscriber, # callback to be called when the store value changes
+                  weak: bool = False, # do not keep `callback` alive, unsubscribe when it is garbage collected
+                  lane: int = NORMAL # `CRITICAL` subscribers are called first, `LOW` ones last, see `propagation`
                   ) -> Unsubscriber:
         ''' Adds callback to the list of subscribers.'''
-        self.subscribers.add(callback)
+        link = self.subscribers.add(utils.weak(callback, lambda: unsubscribe()) if weak else callback, lane)
+        if hooks.active: hooks.emit('subscribe', self, fanout=len(self.subscribers))
         if (len(self.subscribers) == 1):
             self.stop = self.start(self.__set) or (lambda: None) #type: ignore
         callback(self.value)
         def unsubscribe() -> None:
             ''' Removes callback from the list of subscribers.'''
-            self.subscribers.remove(callback) if callback in self.subscribers else None
+            if self.subscribers.remove(link) and hooks.active: hooks.emit('unsubscribe', self, fanout=len(self.subscribers))
             if (len(self.subscribers) == 0):
                 self.stop() if self.stop else None #type: ignore
                 self.stop = None #type: ignore
@@ -66,10 +88,37 @@ class Store(Readable[T]):
             new_value: T # The new value of the store
             ) -> None:
         ''' Internal implementation of set used inside Readable Store, which does not exposes set.'''
-        if (utils.safe_not_equal(self.value, new_value)):
+        if propagation.depth or propagation.scheduler and propagation.open_tick(): # inside a batch: subscribers are notified once, when the batch closes
+            old_value, self.value = self.value, new_value
+            if hooks.active: hooks.emit('set', self, changed=None)
+            if self in propagation.pending: return
+            if propagation.flushing: self.__commit(old_value) # written by a node recomputed when the batch closes, see `propagation.commit`
+            else: propagation.defer(self, partial(self.__commit, old_value), CRITICAL)
+        elif not self.equals(self.value, new_value):
             self.value = new_value
-            for subscriber in self.subscribers:
-                subscriber(new_value)
+            if hooks.active: hooks.emit('set', self, changed=True)
+            self.__notify()
+        elif hooks.active: hooks.emit('set', self, changed=False)
+
+    def __notify(self,
+                 lane: Optional[int] = None # only notify the subscribers of `lane`
+                 ) -> None:
+        ''' Calls the subscribers with the current value, then recomputes the derived stores invalidated by it.'''
+        started = hooks.active and now()
+        try:
+            for subscriber in self.subscribers if lane is None else self.subscribers.in_lane(lane):
+                subscriber(self.value)
+            if started: hooks.emit('notify', self, now() - started, fanout=len(self.subscribers))
+        finally: propagation.flush() # even if a subscriber raised: the nodes it invalidated are not left dirty for the next write
+
+    def __commit(self,
+                 old_value: T # value of the store before the batch
+                 ) -> None:
+        ''' Notifies the subscribers at the end of a batch, each in its lane, if the value changed during the batch.'''
+        if self.equals(old_value, self.value): return
+        for lane in self.subscribers.lanes():
+            if lane == CRITICAL: self.__notify(lane) # already in the CRITICAL lane, or draining the queue: invalidates the derived stores right away
+            else: propagation.defer((self, lane), partial(self.__notify, lane), lane)
 
     def set(self,
             new_value: T # The new value of the store
@@ -81,127 +130,314 @@ class Store(Readable[T]):
                fn: Callable[[T], T] # a callback that takes the existing store value and updates it
                ) -> None:
         ''' Update the store value by applying `fn` to the existing value.'''
-        self.set(fn(self.value))
+        self.set(fn(self.get()))
 
     def __len__(self) -> int:
         ''' The length of the store is the number of subscribers.'''
         return len(self.subscribers)
 
     def __repr__(self) -> str:
-        return f"w<{len(self)}> ${self.value.__class__.__name__}: {self.value.__repr__()}"
+        value = self.get()
+        return f"w<{len(self)}> ${value.__class__.__name__}: {value.__repr__()}"
 
     def __getattr__(self, k):
         '''Called if property not found in Store object.'''
-        conditions = [
-            isinstance(k, (int, str)),
-            not isinstance(self, DerivedStore), #type: ignore
-            k[:2]!='__'
-        ]
-        if all(conditions):
-            if isinstance(self.value, dict) and k in self.value:
-                return self.value[k] # look in Store value
-            if hasattr(self.value, k): 
-                return getattr(self.value, k) # look in Store value
+        if self.proxy and k[:2] != '__' and k not in self._fields: # an unset field must not look in the value
+            value = self.get()
+            if isinstance(value, dict) and k in value:
+                return value[k] # look in Store value
+            if hasattr(value, k):
+                return getattr(value, k) # look in Store value
         raise AttributeError(k)
 
     def __setattr__(self, k:str,v) -> None:
-        exceptions = ['value', 'subscribers', 'start', 'stop', 'sources', 'fn', 'target']
-
-        if k not in exceptions:
-            new_value = self.value
-            if isinstance(self.value, dict) and k in self.value:
-                new_value = {**self.value, k:v}
-            if hasattr(self.value, k):
-                new_value = self.value.__class__(**{**self.value.__dict__, k:v})
+        if k in self._fields: object.__setattr__(self, k, v) # fast path for the fields of the store
+        elif self.proxy:
+            value = new_value = self.get() # not `self.value`, which is stale in an unsubscribed `PathStore`
+            if isinstance(value, dict) and k in value:
+                new_value = {**value, k:v}
+            if hasattr(value, k):
+                new_value = value.__class__(**{**value.__dict__, k:v})
             # uses set instead of __set because this shouldn't work with readable store 
             self.set(new_value)
         else: super().__setattr__(k,v)
+Store._fields = frozenset(Store.__slots__) # names of the fields, set directly by `__setattr__`
 
-# %% ../nbs/00_stores.ipynb 12
+# %% ../nbs/00_stores.ipynb 15
 def writable(value: T = None, # initial value of the store
-             start: Notifier = utils.noop # Optional Notifier, a function called when the first subscriber is added
+             start: Notifier = utils.noop, # Optional Notifier, a function called when the first subscriber is added
+             equals: Equality = utils.safe_equal # Equality policy, see `utils.safe_equal`
              ) -> Writable[T]: # Writable Store
     ''' Creates a new Writable Store (A Writable factory).'''
-    return Store(value, start)
+    return Store(value, start, equals)
 
-# %% ../nbs/00_stores.ipynb 15
+# %% ../nbs/00_stores.ipynb 23
 class ReadableStore(Store[T]):
     ''' A Readable Store.'''
+    __slots__ = ()
     def __init__(self,
                  initial_value: T, # initial value of the store
-                 start: Notifier # function called when the first subscriber is added
+                 start: Notifier, # function called when the first subscriber is added
+                 equals: Equality = utils.safe_equal # Equality policy
                 ) -> None:
-        super().__init__(initial_value, start)
+        super().__init__(initial_value, start, equals)
     def set(self, *args, **kwargs): raise Exception("Cannot set a Readable Store.")
     def update(self, *args, **kwargs): raise Exception("Cannot update a Readable Store.")
     def __repr__(self) -> str: return "r" + super().__repr__()[1:]
 
-# %% ../nbs/00_stores.ipynb 17
+# %% ../nbs/00_stores.ipynb 25
 def readable(value: T, # initial value of the store
-             start: Notifier  # function called when the first subscriber is added
+             start: Notifier,  # function called when the first subscriber is added
+             equals: Equality = utils.safe_equal # Equality policy, see `utils.safe_equal`
              ) -> Readable[T]:  # Readable Store
     ''' Creates a new Readable Store (A Readable factory).'''
-    return ReadableStore(value, start)
+    return ReadableStore(value, start, equals)
 
-# %% ../nbs/00_stores.ipynb 21
+# %% ../nbs/00_stores.ipynb 29
 from .utils import compose
-from fastcore.foundation import L
 
-# %% ../nbs/00_stores.ipynb 22
+# %% ../nbs/00_stores.ipynb 30
 class DerivedStore(Store[T]):
     ''' A Derived Store.'''
+    __slots__ = ('sources', 'functions', 'fn', 'target', 'dirty', 'set_fn', 'executor', 'weak', 'inputs', 'call', 'unsubscribers', 'skipped', 'fused')
+    proxy = False
     def __init__(self,
                  s: Union[Store, list[Store]], # source store(s)
                  *functions: Callable, # a callback that takes the source store(s) values and returns the derived value
+                 equals: Equality = utils.safe_equal, # Equality policy of the derived value
+                 executor: Optional[Executor] = None, # runs the functions off the writer's thread, see `derived`
+                 weak: bool = False # the sources do not keep the derived store alive, see `derived`
              ) -> None:
-        self.sources = L(s)
+        self.sources: tuple = tuple(s) if isinstance(s, (list, tuple)) else (s,)
         if not all(isinstance(x, Store) for x in self.sources):
             raise Exception("s must be a Store or a list of Stores")
+        self.functions: tuple = functions # applied by the executor, see `derived`
         self.fn = compose(*functions)
+        self.rank = 1 + max((s.rank for s in self.sources), default=0) # ranked above all its sources
+        self.dirty = False # True while queued for recomputation
+        self.set_fn: Optional[Subscriber] = None # sets the target value, only while the target has subscribers
+        self.executor = utils.Latest(executor) if executor else None
+        self.weak = weak
+        self.inputs: tuple = self.sources # the stores subscribed to while started, see `fuse`
+        self.call: Callable = self.fn # applied to the values of `inputs`
+        self.unsubscribers: list = []
+        self.skipped: list = [] # the derived stores fused into this one while started
+        self.fused: Optional[set] = None # the started derived stores fused over this one
 
         def start(set_fn: Subscriber):
-            def sync(x=None): # x is ignored
-                values = self.sources.map(lambda x: x.get())
-                set_fn(self.fn(*values))
-            sync() # sync target with source values, they can have changed since Derived creation
-            unsubscribers = self.sources.map(lambda s: s.subscribe(sync))
+            self.connect()
+            self.set_fn = set_fn
+            self.recompute() # sync target with source values, they can have changed since Derived creation
+            for node in list(self.fused or ()): node.reconnect() # subscribed now: no longer fused, see `fuse`
             def stop():
-                for unsubscribe in unsubscribers: unsubscribe()
+                self.set_fn = None
+                if self.executor: self.executor.cancel()
+                for node in self.skipped: node.fused.discard(self)
+                for unsubscribe in self.unsubscribers: unsubscribe()
+                self.unsubscribers, self.skipped = [], []
             return stop
-        values = self.sources.map(lambda x: x.get())
-        self.target = readable(self.fn(*values), start)
+        values = [x.get() for x in self.sources]
+        self.target = readable(None if executor else self.fn(*values), start, equals)
+        self.target.rank = self.rank
+        self.target.node = self
+
+    def fuse(self) -> tuple:
+        ''' The stores to subscribe to, the function applied to their values, and the derived stores skipped.
+
+        While a store computed from a single source has no subscribers, the derived stores over it alone can skip it:
+        they subscribe to its sources instead and apply its function as their first stage, see `utils.Stages`.'''
+        sources, functions, skipped = self.sources, [self.fn], []
+        while not self.executor and len(sources) == 1:
+            node = sources[0].node
+            if node is None or node.target is not sources[0] or len(node.sources) != 1 or node.executor or node.target.subscribers or node.target.equals is not utils.safe_equal: break
+            sources = node.sources
+            functions.insert(0, node.fn)
+            skipped.append(node)
+        return sources, utils.Stages(functions) if skipped else self.fn, skipped
+
+    def connect(self) -> None:
+        ''' Subscribes to the inputs given by `fuse`.'''
+        self.inputs, self.call, self.skipped = self.fuse()
+        for node in self.skipped:
+            if node.fused is None: node.fused = set()
+            node.fused.add(self)
+        self.unsubscribers = [s.subscribe(self.invalidate, self.weak, CRITICAL) for s in self.inputs] # see `propagation.commit`
+
+    def reconnect(self) -> None:
+        ''' Subscribes again, when a derived store skipped by `fuse` got a subscriber.'''
+        unsubscribers, set_fn, self.set_fn = self.unsubscribers, self.set_fn, None # the values did not change: nothing to recompute
+        for node in self.skipped: node.fused.discard(self)
+        try: self.connect()
+        finally:
+            self.set_fn = set_fn
+            for unsubscribe in unsubscribers: unsubscribe()
+
+    def invalidate(self, x=None) -> None: # x is ignored
+        ''' Subscribed to the sources: queues the recomputation instead of running it right away.'''
+        if self.set_fn: propagation.schedule(self)
+
+    def recompute(self) -> None:
+        ''' Applies `fn` to the current values of the sources and sets the target.'''
+        if not self.set_fn: return
+        if self.executor: return self.executor.submit(self.land, utils.apply, self.functions, *[x.get() for x in self.sources])
+        started = hooks.active and now()
+        value = self.call(*[x.get() for x in self.inputs])
+        if started: hooks.emit('recompute', self.target, now() - started)
+        if value is not utils.unchanged: self.set_fn(value) # a fused stage did not change, see `fuse`
+
+    def land(self, value: T) -> None:
+        ''' Sets the target with a value computed by the executor.'''
+        if self.set_fn: self.set_fn(value)
 
     def get(self): return self.target.get()
     def set(self, *args, **kwargs): raise Exception("Cannot set a Derived Store.")
     def update(self, *args, **kwargs): raise Exception("Cannot update a Derived Store.")
     def subscribe(self,
-                  callback: Subscriber # callback to be called when any of the source stores change
+                  callback: Subscriber, # callback to be called when any of the source stores change
+                  weak: bool = False, # do not keep `callback` alive, see `Store.subscribe`
+                  lane: int = NORMAL # see `Store.subscribe`
                   ) -> Unsubscriber:
         ''' Adds callback to the list of subscribers.'''
-        return self.target.subscribe(callback)
+        return self.target.subscribe(callback, weak, lane)
 
-# %% ../nbs/00_stores.ipynb 24
+# %% ../nbs/00_stores.ipynb 32
 def derived(s: Union[Store, list[Store]], # source store(s)
-            *functions: list(Callable[...,T]) # a callback that takes the source store(s) values and returns the derived value
+            *functions: list(Callable[...,T]), # a callback that takes the source store(s) values and returns the derived value
+            equals: Equality = utils.safe_equal, # Equality policy of the derived value, see `utils.safe_equal`
+            executor: Optional[Executor] = None, # a thread or process pool running the functions, see below
+            weak: bool = False # subscribe to the sources weakly, see below
             ) -> Readable: # Derived Store
     ''' Creates a new Derived Store (A Derived factory).'''
-    return DerivedStore(s, *functions).target
+    return DerivedStore(s, *functions, equals=equals, executor=executor, weak=weak).target
 
-# %% ../nbs/00_stores.ipynb 28
-import fastcore.all as fc
+# %% ../nbs/00_stores.ipynb 45
+def set_many(values: dict # maps each Writable store to its new value
+             ) -> None:
+    ''' Sets several stores at once, notifying subscribers and derived stores only after all values are set.'''
+    with batch():
+        for store, value in values.items(): store.set(value)
 
-# %% ../nbs/00_stores.ipynb 29
-@fc.patch
+# %% ../nbs/00_stores.ipynb 52
 def pipe(self:Store, # source store
          *functions: list(Callable[...,T]) # functions that transform the source store
          )->Readable[T]: # returned store
      ''' Unix-like Pipe operator.'''
      return derived(self, *functions)
+Store.pipe = pipe
 
-# %% ../nbs/00_stores.ipynb 31
-@fc.patch
+# %% ../nbs/00_stores.ipynb 54
 def __or__(self:Store, # source store
            other: Callable[...,T] # function that transforms the source store
            ) -> Readable[T]: # returned store
     ''' self | other  works like Unix pipes. It returns a Derived Store that is the result of applying other to self.'''
     return self.pipe(other)
+Store.__or__ = __or__
+
+# %% ../nbs/00_stores.ipynb 59
+class PathStore(Store[T]):
+    ''' A Writable Store scoped to a path inside the value of another store.'''
+    __slots__ = ('root', 'path')
+    def __init__(self,
+                 root: Store, # the store holding the whole value
+                 path: tuple # keys, indexes or attribute names
+                 ) -> None:
+        self.root = root
+        self.path = path
+        def start(set_fn: Subscriber):
+            return root.subscribe(lambda value: set_fn(utils.get_in(value, path, None)), lane=CRITICAL) # like a derived store
+        super().__init__(utils.get_in(root.get(), path, None), start, PathStore.unchanged)
+
+    @staticmethod
+    def unchanged(a, b) -> bool:
+        ''' Values off the written path are shared with the previous value, so they are the same object.'''
+        return a is b or utils.safe_equal(a, b)
+
+    def get(self) -> T: return utils.get_in(self.root.get(), self.path, None)
+    __call__ = get
+
+    def set(self,
+            new_value: T # The new value at the path
+            ) -> None:
+        ''' Sets the value at the path, through the root store.'''
+        self.root.set(utils.assoc_in(self.root.get(), self.path, new_value))
+
+    def __repr__(self) -> str: return f"{'.'.join(map(str, self.path))}" + super().__repr__()[1:]
+
+# %% ../nbs/00_stores.ipynb 60
+def select(self:Store, # source store
+           path: Union[str, Sequence] # dot separated keys, e.g. 'a.b.c', or a sequence of keys and indexes
+           ) -> PathStore: # store scoped to the path
+    ''' Returns a store scoped to `path` inside the value of this store.'''
+    path = tuple(path.split('.')) if isinstance(path, str) else tuple(path)
+    if isinstance(self, PathStore): return PathStore(self.root, self.path + path)
+    return PathStore(self, path)
+Store.select = select
+
+def at(self:Store, # source store
+       key: Any # a key, index or attribute name
+       ) -> PathStore: # store scoped to the key
+    ''' Returns a store scoped to `key` inside the value of this store.'''
+    return self.select((key,))
+Store.at = at
+
+# %% ../nbs/00_stores.ipynb 64
+ChangeSubscriber = Callable[[Any, Any], None] # called with the value and the delta of the change, or `...`
+
+class ChangeStore(Store[T]):
+    ''' Base class of the Writable Stores changed in place, that notify the delta of each change.'''
+    __slots__ = ('changes', 'deltas')
+    def __init__(self,
+                 initial_value: Any, # initial value of the store
+                 start: Notifier = utils.noop, # A Notifier (Optional), its `set_fn` is the store `set`
+                 equals: Equality = utils.safe_equal # Equality policy of the values passed to `set`
+                 ) -> None:
+        super().__init__(initial_value, lambda set_fn: start(self.set), equals)
+        self.changes = utils.Subscribers() # change subscribers, in subscription order
+        self.deltas: dict = {} # deltas of the changes made during the current batch, by lane of the subscribers to notify
+
+    def merge(self, deltas: list) -> Any: ... # a single delta for all the `deltas` of a batch, none of them `...`
+
+    def changed(self,
+                delta: Any = ... # what changed in the value, `...` for the whole value
+                ) -> None:
+        ''' Notifies the subscribers that the value changed in place.'''
+        deferred = propagation.depth or propagation.scheduler and propagation.open_tick()
+        if hooks.active: hooks.emit('set', self, changed=None if deferred else True, delta=delta)
+        if deferred: # inside a batch: the deltas are merged and notified in each lane when the batch closes
+            for lane in self.subscribers.lanes(): # including the lanes of the change subscribers, see `subscribe_changes`
+                if lane == CRITICAL and propagation.flushing: # written by a node recomputed when the batch closes, see `propagation.commit`
+                    self.__notify(delta, lane)
+                    continue
+                deltas = self.deltas.get(lane)
+                if deltas is None:
+                    self.deltas[lane] = [delta]
+                    propagation.defer((self, lane), partial(self.__commit, lane), lane)
+                else: deltas.append(delta)
+        else: self.__notify(delta)
+
+    def __commit(self, lane: int) -> None:
+        deltas = self.deltas.pop(lane)
+        self.__notify(... if any(delta is ... for delta in deltas) else self.merge(deltas), lane)
+
+    def __notify(self, delta: Any, lane: Optional[int] = None) -> None:
+        started = hooks.active and now()
+        try:
+            for subscriber in self.changes if lane is None else self.changes.in_lane(lane):
+                subscriber(self.value, delta)
+            for subscriber in self.subscribers if lane is None else self.subscribers.in_lane(lane):
+                subscriber(self.value)
+            if started: hooks.emit('notify', self, now() - started, fanout=len(self.changes) + len(self.subscribers), delta=delta)
+        finally: propagation.flush() # see `Store.__notify`
+
+    def subscribe_changes(self,
+                          callback: ChangeSubscriber, # called with the value and the delta of the change
+                          lane: int = NORMAL # see `Store.subscribe`
+                          ) -> Unsubscriber:
+        ''' Adds a change subscriber. It is called right away with `...`, then on every change.'''
+        link = self.changes.add(callback, lane)
+        unsubscribe = self.subscribe(utils.noop, lane=lane) # starts and stops the store along with its change subscribers
+        callback(self.value, ...)
+        def unsubscribe_changes() -> None:
+            self.changes.remove(link)
+            unsubscribe()
+        return unsubscribe_changes
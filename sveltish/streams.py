@@ -0,0 +1,112 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/05_streams.ipynb.
+
+# %% auto 0
+__all__ = ['IterableStore', 'from_iterable', 'from_async_iter', 'stream', 'astream']
+
+# %% ../nbs/05_streams.ipynb 4
+import asyncio
+from collections import deque
+from threading import Condition, Event, Lock, RLock, Thread
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, Optional
+import sveltish.utils as utils
+from .stores import T, Store, ReadableStore, Subscriber, Unsubscriber, Equality, Readable, readable
+from .propagation import NORMAL
+
+# %% ../nbs/05_streams.ipynb 6
+class IterableStore(ReadableStore[T]):
+    ''' A Readable Store whose value is the last item read from an iterable, by a thread, while it has subscribers.'''
+    __slots__ = ('iterator', 'reading', 'lock')
+    def __init__(self,
+                 iterable: Iterable[T], # the source
+                 initial_value: Optional[T] = None, # value of the store before the first item
+                 equals: Equality = utils.safe_equal # Equality policy, see `utils.safe_equal`
+                 ) -> None:
+        self.iterator = iter(iterable)
+        self.reading = Lock() # held by the reading thread: a restarted store waits for the previous one to stop
+        self.lock = RLock() # the thread only writes once the subscription that started it has received the current value
+        super().__init__(initial_value, self.read, equals)
+
+    def subscribe(self, callback: Subscriber, weak: bool = False, lane: int = NORMAL) -> Unsubscriber:
+        with self.lock: return super().subscribe(callback, weak, lane)
+
+    def read(self, set_fn: Subscriber) -> Unsubscriber:
+        ''' The `start` notifier: reads the iterable in a new thread, until the returned function is called.'''
+        stopped = Event()
+        def read() -> None:
+            with self.reading:
+                while not stopped.is_set():
+                    try: item = next(self.iterator)
+                    except StopIteration: return
+                    with self.lock: set_fn(item)
+        Thread(target=read, daemon=True).start()
+        return stopped.set
+
+def from_iterable(iterable: Iterable[T], # the source, read by a thread while the store has subscribers
+                  initial_value: Optional[T] = None, # value of the store before the first item
+                  equals: Equality = utils.safe_equal # Equality policy, see `utils.safe_equal`
+                  ) -> Readable[T]: # Readable Store
+    ''' Creates a Readable Store whose value is the last item read from `iterable`.'''
+    return IterableStore(iterable, initial_value, equals)
+
+# %% ../nbs/05_streams.ipynb 9
+def from_async_iter(aiterable: AsyncIterable[T], # the source, read by a task while the store has subscribers
+                    initial_value: Optional[T] = None, # value of the store before the first item
+                    equals: Equality = utils.safe_equal # Equality policy, see `utils.safe_equal`
+                    ) -> Readable[T]: # Readable Store
+    ''' Creates a Readable Store whose value is the last item read from `aiterable`. Must be subscribed from a running event loop.'''
+    iterator = aiterable.__aiter__()
+    pending: Optional[asyncio.Future] = None # the read in progress, kept when the store is stopped
+
+    def start(set_fn: Subscriber) -> Unsubscriber:
+        async def read() -> None:
+            nonlocal pending
+            while True:
+                if pending is None: pending = asyncio.ensure_future(iterator.__anext__())
+                try: item = await asyncio.shield(pending) # cancelling the task must not close the iterator
+                except StopAsyncIteration: return
+                pending = None
+                set_fn(item)
+        return asyncio.get_running_loop().create_task(read()).cancel
+    return readable(initial_value, start, equals)
+
+# %% ../nbs/05_streams.ipynb 13
+def stream(self:Store, # source store
+           maxsize: int = 16 # size of the buffer, the oldest values are dropped when it is full
+           ) -> Iterator[T]: # generator of the store values
+    ''' Iterates over the values of the store, waiting for the next one when all were consumed.'''
+    buffer: deque = deque(maxlen=maxsize)
+    ready = Condition()
+    def push(value: T) -> None:
+        with ready:
+            buffer.append(value)
+            ready.notify()
+    unsubscribe = self.subscribe(push)
+    try:
+        while True:
+            with ready:
+                ready.wait_for(lambda: buffer)
+                value = buffer.popleft()
+            yield value
+    finally: unsubscribe()
+Store.stream = stream
+
+# %% ../nbs/05_streams.ipynb 16
+async def astream(self:Store, # source store
+                  maxsize: int = 16 # size of the buffer, the oldest values are dropped when it is full
+                  ) -> AsyncIterator[T]: # async generator of the store values
+    ''' Iterates asynchronously over the values of the store. The store can be written from any thread.'''
+    buffer: deque = deque(maxlen=maxsize)
+    ready = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    def push(value: T) -> None:
+        buffer.append(value)
+        loop.call_soon_threadsafe(ready.set)
+    unsubscribe = self.subscribe(push)
+    try:
+        while True:
+            while not buffer:
+                ready.clear()
+                if not buffer: await ready.wait()
+            yield buffer.popleft()
+    finally: unsubscribe()
+Store.astream = astream
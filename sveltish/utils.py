@@ -1,7 +1,9 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/10_utils.ipynb.
 
 # %% auto 0
-__all__ = ['noop', 'identity', 'safe_not_equal', 'compose', 'Bunch', 'NamedBunch']
+__all__ = ['unchanged', 'noop', 'identity', 'safe_not_equal', 'safe_equal', 'identical', 'structural_equal', 'array_equal',
+           'KeyEqual', 'versioned', 'fingerprint', 'compose', 'Stages', 'Bunch', 'NamedBunch', 'Link', 'Subscribers',
+           'weak', 'get_in', 'assoc_in', 'apply', 'Latest']
 
 # %% ../nbs/10_utils.ipynb 3
 def noop(*args, **kwargs): return None
@@ -12,15 +14,65 @@ def identity(x): return x
 # %% ../nbs/10_utils.ipynb 7
 def safe_not_equal(a,b):
     "Check if `a` is not equal to `b`"
-    primitive = (int, str, bool, frozenset, tuple)
-    return (a != b) if isinstance(a, primitive) else True
+    primitive = (int, float, complex, str, bytes, bool, frozenset, tuple, type(None))
+    if isinstance(a, primitive) and isinstance(b, primitive):
+        return (a != b) and not (a != a and b != b) # nan is equal to nan
+    return True
 
-# %% ../nbs/10_utils.ipynb 9
-from functools import reduce
+# %% ../nbs/10_utils.ipynb 10
+def safe_equal(a,b):
+    "Default equality policy: the negation of `safe_not_equal`"
+    return not safe_not_equal(a,b)
+
+def identical(a,b):
+    "Equality policy: `a` and `b` are the same object"
+    return a is b
+
+def structural_equal(a,b):
+    "Equality policy: `a == b`, e.g. for dicts, lists and dataclasses that are replaced, not mutated"
+    if a is b: return True
+    try: return bool(a == b)
+    except (TypeError, ValueError): return False # e.g. == is elementwise and ambiguous
+
+def array_equal(a,b):
+    "Equality policy for NumPy arrays: same shape, dtype and contents"
+    import numpy as np # optional dependency, only needed by stores holding arrays
+    if a is b: return True
+    if not (isinstance(a, np.ndarray) and isinstance(b, np.ndarray)): return structural_equal(a, b)
+    return a.shape == b.shape and a.dtype == b.dtype and np.array_equal(a, b)
+
+# %% ../nbs/10_utils.ipynb 14
+from operator import attrgetter
+from typing import Any, Callable, Hashable, Optional
+
+# %% ../nbs/10_utils.ipynb 15
+class KeyEqual:
+    "Stateful equality policy comparing `key(value)` with the key of the last value seen"
+    def __init__(self, key: Callable[[Any], Hashable]): self.key, self.last = key, None
+    def prime(self, value):
+        "Remembers the key of `value`, the initial value of the store using the policy"
+        self.last = self.key(value)
+    def __call__(self, a, b):
+        last = self.last if self.last is not None else self.key(a)
+        self.last = self.key(b)
+        return last == self.last
+
+def versioned(attr: str = 'version') -> KeyEqual:
+    "Equality policy comparing a version counter that is bumped on each mutation"
+    return KeyEqual(attrgetter(attr))
+
+def _digest(value) -> bytes:
+    import pickle, hashlib # imported on first use, to keep `import sveltish` fast
+    return hashlib.blake2b(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), digest_size=16).digest()
+
+def fingerprint(key: Callable[[Any], Hashable] = _digest) -> KeyEqual:
+    "Equality policy comparing hashed fingerprints of the values, by default a digest of their pickled contents"
+    return KeyEqual(key)
+
+# %% ../nbs/10_utils.ipynb 17
 from typing import Callable, TypeVar,  Generic, Union, Optional, Set, Protocol, Any
-from typing_extensions import Annotated
 
-# %% ../nbs/10_utils.ipynb 10
+# %% ../nbs/10_utils.ipynb 18
 def compose( 
     *functions # functions to be composed (left to right)
 ) -> Callable[[Any], Any]:  # composed function
@@ -32,12 +84,35 @@ def compose(
         ... 
     """    
     if (len(functions)==0): return lambda x: x # compose()(x) = x
-    def pack(x): return x if type(x) is tuple else (x,)
-    def call(f, g):
-       return lambda *x: g(*pack(f(*pack(x)))) # call in reverse order
-    return reduce(call, functions)  # composed function
+    if (len(functions)==1): return functions[0] # compose(f) = f, no extra call frame
+    first, rest = functions[0], functions[1:]
+    def composed(*x):
+        x = first(*x)
+        for f in rest: x = f(*x) if type(x) is tuple else f(x) # tuples are spread over the next function's arguments
+        return x
+    return composed  # composed function
 
-# %% ../nbs/10_utils.ipynb 15
+# %% ../nbs/10_utils.ipynb 21
+unchanged = object() # returned by `Stages` when the result cannot have changed
+
+class Stages:
+    "Composition of `functions` skipping the stages after one whose result did not change"
+    __slots__ = ('first', 'middle', 'last', 'results')
+    def __init__(self, functions: tuple): # at least 2 functions
+        self.first, self.middle, self.last = functions[0], functions[1:-1], functions[-1]
+        self.results = [unchanged] * (len(functions) - 1) # result of each stage but the last
+    def __call__(self, *x):
+        results = self.results
+        x = self.first(*x)
+        if safe_equal(results[0], x): return unchanged
+        results[0] = x
+        for i, f in enumerate(self.middle, 1):
+            x = f(x)
+            if safe_equal(results[i], x): return unchanged
+            results[i] = x
+        return self.last(x)
+
+# %% ../nbs/10_utils.ipynb 26
 class Bunch(dict):
     __init__     = lambda self, **kw: setattr(self, '__dict__', kw) #type: ignore
     __repr__     = lambda self: f'{self.__class__.__name__}({self.__dict__})'
@@ -51,3 +126,157 @@ class NamedBunch(Bunch):
     def __init__(self, name, **kw):
         super().__init__(**kw)
         self.__class__.__name__ = name
+
+# %% ../nbs/10_utils.ipynb 28
+class Link:
+    "A subscriber in a `Subscribers` registry"
+    __slots__ = ('callback', 'prev', 'next', 'order', 'removed', 'lane')
+    def __init__(self, callback: Callable, prev: Optional['Link'], order: int, lane: int = 0):
+        self.callback, self.prev, self.next, self.order, self.removed, self.lane = callback, prev, None, order, False, lane
+
+class Subscribers:
+    "Ordered registry of callbacks with O(1) add and remove, iterable without copying"
+    __slots__ = ('head', 'tail', 'count', 'order', 'tails')
+    def __init__(self):
+        self.head, self.tail, self.count, self.order = None, None, 0, 0
+        self.tails: dict = {} # the last link of each lane that has subscribers
+
+    def add(self, callback: Callable, lane: int = 0) -> Link:
+        "Appends `callback` to the subscribers of its `lane`, returning the `Link` used to remove it"
+        self.order += 1
+        before = [l for l in self.tails if l <= lane] # a few lanes at most, see `propagation`
+        prev = self.tails[max(before)] if before else None
+        link = Link(callback, prev, self.order, lane)
+        self.tails[lane] = link
+        link.next = prev.next if prev else self.head
+        if link.next: link.next.prev = link
+        else: self.tail = link
+        if prev: prev.next = link
+        else: self.head = link
+        self.count += 1
+        return link
+
+    def lanes(self) -> list:
+        "The lanes of the subscribers, lowest first"
+        return sorted(self.tails)
+
+    def remove(self, link: Link) -> bool:
+        "Removes `link`, returning False if it was already removed"
+        if link.removed: return False
+        link.removed = True
+        link.callback = None # `link` can outlive the subscription, e.g. through the next pointer of an earlier removed link
+        if self.tails[link.lane] is link:
+            if link.prev and link.prev.lane == link.lane: self.tails[link.lane] = link.prev
+            else: del self.tails[link.lane]
+        if link.prev: link.prev.next = link.next
+        else: self.head = link.next
+        if link.next: link.next.prev = link.prev
+        else: self.tail = link.prev
+        self.count -= 1
+        return True # link.next is kept, so an iteration standing on `link` can go on
+
+    def __iter__(self):
+        last = self.order # links added during the iteration are not visited
+        link = self.head
+        while link:
+            if not link.removed and link.order <= last: yield link.callback
+            link = link.next
+
+    def in_lane(self, lane: int):
+        "Iterates the callbacks of `lane`, like `__iter__`"
+        last = self.order
+        link = self.head
+        while link and link.lane < lane: link = link.next
+        while link and link.lane == lane:
+            if not link.removed and link.order <= last: yield link.callback
+            link = link.next
+
+    def __len__(self) -> int: return self.count
+    def __bool__(self) -> bool: return self.count > 0
+    def __repr__(self) -> str: return f'Subscribers({list(self)})'
+
+# %% ../nbs/10_utils.ipynb 33
+import sys, weakref
+
+def weak(callback: Callable, # a function, or a method bound to an object supporting weak references
+         on_dead: Callable[[], Any] # called when `callback` is garbage collected
+         ) -> Callable: # forwards to `callback` while it is alive
+    "A callback that does not keep `callback` alive"
+    def dead(_, is_finalizing=sys.is_finalizing):
+        if not is_finalizing(): on_dead() # nothing to clean up while the interpreter exits
+    ref = (weakref.WeakMethod if hasattr(callback, '__func__') else weakref.ref)(callback, dead)
+    def forward(*args):
+        fn = ref()
+        if fn is not None: return fn(*args)
+    forward.__wrapped__ = ref # see `instrument.node_of`
+    return forward
+
+# %% ../nbs/10_utils.ipynb 36
+def get_in(value, # nested dicts, lists, tuples or objects
+           path: tuple, # keys, indexes or attribute names
+           *default # returned when the path is missing, instead of raising
+           ):
+    "Value at `path` inside `value`"
+    try:
+        for k in path:
+            if isinstance(value, dict): value = value[k]
+            elif isinstance(value, (list, tuple)): value = value[int(k)] # the keys of a dotted path are strings
+            else: value = getattr(value, k)
+    except (LookupError, AttributeError, TypeError, ValueError):
+        if default: return default[0]
+        raise
+    return value
+
+def assoc_in(value, # nested dicts, lists, tuples or objects
+             path: tuple, # keys, indexes or attribute names
+             new # the new value at `path`
+             ):
+    "Copy of `value` with `new` at `path`, sharing everything off the path with `value`"
+    if not path: return new
+    k, rest = path[0], path[1:]
+    if isinstance(value, dict): return {**value, k: assoc_in(value.get(k, {}), rest, new)}
+    if isinstance(value, (list, tuple)):
+        items, k = list(value), int(k)
+        items[k] = assoc_in(items[k], rest, new)
+        return items if isinstance(value, list) else tuple(items)
+    return value.__class__(**{**value.__dict__, k: assoc_in(getattr(value, k), rest, new)})
+
+# %% ../nbs/10_utils.ipynb 39
+def apply(functions: tuple, # functions composed left to right, see `compose`
+          *args # arguments of the first function
+          ) -> Any:
+    "`compose(*functions)(*args)`, picklable when the functions are"
+    return compose(*functions)(*args)
+
+class Latest:
+    "Runs calls in an executor, delivering only the result of the latest one"
+    __slots__ = ('executor', 'future', 'generation')
+    def __init__(self, executor): self.executor, self.future, self.generation = executor, None, 0
+
+    def submit(self,
+               deliver: Callable[[Any], None], # called with the result, unless a later call was submitted meanwhile
+               fn: Callable, # run in the executor
+               *args) -> None:
+        "Runs `fn(*args)` in the executor, superseding the call in progress"
+        self.cancel()
+        generation = self.generation
+        try:
+            import asyncio
+            loop = asyncio.get_running_loop()
+        except RuntimeError: loop = None
+        def land(future):
+            if generation != self.generation or future.cancelled(): return
+            self.future = None
+            deliver(future.result()) # errors raised by fn are reported by the executor or the event loop
+        def done(future):
+            if generation != self.generation or future.cancelled(): return # superseded
+            if loop is None: land(future)
+            else: loop.call_soon_threadsafe(land, future)
+        self.future = self.executor.submit(fn, *args)
+        self.future.add_done_callback(done)
+
+    def cancel(self) -> None:
+        "Cancels the call in progress, or ignores its result if it already started"
+        self.generation += 1
+        if self.future is not None: self.future.cancel()
+        self.future = None